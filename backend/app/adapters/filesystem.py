@@ -4,11 +4,27 @@ import re
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.models.memory_bank import (
     MemoryBank, MemoryBankFile, Task, ChangelogEntry, 
     GenerationSummary, Graph, MemoryBankSummary
 )
 
+
+def _load_json_file(file_path: Path) -> Any:
+    """Load a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class FileSystemAdapter:
     def __init__(self, root_path: str):
         self.root_path = Path(root_path)
@@ -30,7 +46,9 @@ class FileSystemAdapter:
     def get_memory_bank(self, name: str) -> Optional[MemoryBank]:
         """Get a specific memory bank by name"""
         memory_bank_dir = self.root_path / name
-        if not memory_bank_dir.exists():
+        try:
+            dir_stat = memory_bank_dir.stat()
+        except OSError:
             return None
         
         memory_bank_path = memory_bank_dir / "memory-bank"
@@ -51,8 +69,8 @@ class FileSystemAdapter:
             changelog=changelog,
             generation_summary=generation_summary,
             graph=graph,
-            created_at=datetime.fromtimestamp(memory_bank_dir.stat().st_ctime),
-            updated_at=datetime.fromtimestamp(memory_bank_dir.stat().st_mtime)
+            created_at=datetime.fromtimestamp(dir_stat.st_ctime),
+            updated_at=datetime.fromtimestamp(dir_stat.st_mtime)
         )
     
     def _get_memory_bank_summary(self, name: str, path: str) -> Optional[MemoryBankSummary]:
@@ -62,13 +80,10 @@ class FileSystemAdapter:
             return None
         
         # Count files
-        file_count = len([f for f in memory_bank_path.iterdir() if f.is_file() and f.suffix == ".md"])
+        file_count = self._count_markdown_files(memory_bank_path)
         
         # Count tasks
-        tasks_dir = memory_bank_path / "tasks"
-        task_count = 0
-        if tasks_dir.exists():
-            task_count = len([f for f in tasks_dir.iterdir() if f.is_file() and f.suffix == ".md"])
+        task_count = self._count_markdown_files(memory_bank_path / "tasks")
         
         # Check for changelog
         has_changelog = (memory_bank_path / "changelog.md").exists()
@@ -82,20 +97,33 @@ class FileSystemAdapter:
             has_changelog=has_changelog
         )
     
+    @staticmethod
+    def _count_markdown_files(dir_path: Path) -> int:
+        """Count markdown files in a directory without building Path objects"""
+        try:
+            with os.scandir(dir_path) as entries:
+                return sum(1 for entry in entries if entry.name.endswith(".md") and entry.is_file())
+        except FileNotFoundError:
+            return 0
+    
     def _parse_memory_bank_files(self, memory_bank_path: Path) -> List[MemoryBankFile]:
         """Parse markdown files in the memory bank"""
         files = []
         
-        for file_path in memory_bank_path.iterdir():
-            if file_path.is_file() and file_path.suffix == ".md":
+        # scandir entries carry their own stat data, so each file is stat'ed once
+        with os.scandir(memory_bank_path) as entries:
+            for entry in entries:
+                if not (entry.name.endswith(".md") and entry.is_file()):
+                    continue
+                file_path = Path(entry.path)
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
                     
-                    stat = file_path.stat()
+                    stat = entry.stat()
                     files.append(MemoryBankFile(
-                        name=file_path.name,
-                        path=str(file_path),
+                        name=entry.name,
+                        path=entry.path,
                         content=content,
                         last_modified=datetime.fromtimestamp(stat.st_mtime),
                         size=stat.st_size
@@ -198,8 +226,7 @@ class FileSystemAdapter:
             return None
         
         try:
-            with open(summary_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(summary_path)
             
             return GenerationSummary(
                 generated_at=datetime.fromisoformat(data['generated_at'].replace('Z', '+00:00')),
@@ -218,8 +245,7 @@ class FileSystemAdapter:
             return None
         
         try:
-            with open(graph_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(graph_path)
             
             return Graph(
                 nodes=data.get('nodes', []),
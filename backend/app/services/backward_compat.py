@@ -3,15 +3,28 @@ Backward compatibility layer for transition period
 Allows bash scripts to still work while testing new backend integration
 """
 
+import asyncio
 import os
 import subprocess
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+async def _run_script(cmd: List[str], cwd: Path) -> Tuple[int, str, str]:
+    """Run a legacy script without blocking the event loop"""
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=str(cwd),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
 class BackwardCompatibilityMode:
     """
     Provides fallback to bash scripts during migration period
@@ -39,23 +52,18 @@ class BackwardCompatibilityMode:
         cmd = ["bash", str(build_script), repo_path, output_name]
         logs.append(f"[LEGACY MODE] Executing: {' '.join(cmd)}")
         
-        process = subprocess.run(
-            cmd,
-            cwd=str(root_path),
-            capture_output=True,
-            text=True
-        )
+        returncode, stdout, stderr = await _run_script(cmd, root_path)
         
-        if process.stdout:
-            logs.extend(process.stdout.strip().split('\n'))
-        if process.stderr:
-            logs.extend(process.stderr.strip().split('\n'))
+        if stdout:
+            logs.extend(stdout.strip().split('\n'))
+        if stderr:
+            logs.extend(stderr.strip().split('\n'))
             
-        if process.returncode != 0:
+        if returncode != 0:
             raise subprocess.CalledProcessError(
-                process.returncode, 
+                returncode, 
                 cmd, 
-                f"Legacy script failed with return code {process.returncode}"
+                f"Legacy script failed with return code {returncode}"
             )
             
         return {
@@ -80,23 +88,18 @@ class BackwardCompatibilityMode:
         cmd = ["bash", str(update_script), repo_path, memory_bank_name]
         logs.append(f"[LEGACY MODE] Executing: {' '.join(cmd)}")
         
-        process = subprocess.run(
-            cmd,
-            cwd=str(root_path),
-            capture_output=True,
-            text=True
-        )
+        returncode, stdout, stderr = await _run_script(cmd, root_path)
         
-        if process.stdout:
-            logs.extend(process.stdout.strip().split('\n'))
-        if process.stderr:
-            logs.extend(process.stderr.strip().split('\n'))
+        if stdout:
+            logs.extend(stdout.strip().split('\n'))
+        if stderr:
+            logs.extend(stderr.strip().split('\n'))
             
-        if process.returncode != 0:
+        if returncode != 0:
             raise subprocess.CalledProcessError(
-                process.returncode, 
+                returncode, 
                 cmd, 
-                f"Legacy script failed with return code {process.returncode}"
+                f"Legacy script failed with return code {returncode}"
             )
             
         return {
@@ -3,6 +3,8 @@ Claude Code SDK Integration Service
 Provides a clean interface for Claude Code SDK within the backend
 """
 
+from __future__ import annotations
+
 import logging
 from typing import AsyncGenerator, Dict, Any, List, Optional
 from pathlib import Path
@@ -4,13 +4,37 @@ Memory Bank Core Module
 Extracted memory bank building logic for reuse across different interfaces.
 """
 
-# Core builders (optional - requires claude_code_sdk)
-try:
-    from .builders.core_builder import CoreMemoryBankBuilder
-    _HAS_CLAUDE_SDK = True
-except ImportError:
-    CoreMemoryBankBuilder = None
-    _HAS_CLAUDE_SDK = False
+import importlib
+import importlib.util
+
+# Core builders (optional - requires claude_code_sdk). The builder and the job
+# manager pull in the SDK, so they are imported on first attribute access
+# (PEP 562) rather than when the package is imported.
+_HAS_CLAUDE_SDK = importlib.util.find_spec("claude_code_sdk") is not None
+
+_LAZY_EXPORTS = {
+    "CoreMemoryBankBuilder": ".builders.core_builder",
+    "JobManager": ".services.job_manager",
+    "DefaultJobStorageAdapter": ".services.job_manager",
+}
+
+
+def __getattr__(name):
+    """Import SDK-dependent exports on first access"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if name != "CoreMemoryBankBuilder":
+            raise
+        value = None
+    
+    globals()[name] = value
+    return value
+
 
 # Models
 from .models.memory_bank import MemoryBank, MemoryBankSummary
@@ -25,9 +49,6 @@ from .models.build_job import (
     BuildJobResponse
 )
 
-# Services
-from .services.job_manager import JobManager, DefaultJobStorageAdapter
-
 # Interfaces
 from .interfaces.storage import MemoryBankStorage, JobStorageInterface
 from .interfaces.validation import JobValidationInterface, DefaultJobValidator
@@ -7,6 +7,7 @@ creating an architectural manifest that guides subsequent component agents.
 
 import json
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable
@@ -19,6 +20,10 @@ from claude_code_sdk.types import SystemMessage
 
 logger = logging.getLogger(__name__)
 
+# Manifest sections: the Mermaid diagram and each "### Component:" block
+_MERMAID_RE = re.compile(r'```mermaid\n(.*?)\n```', re.DOTALL)
+_COMPONENT_RE = re.compile(r'### Component: (.*?)\n(.*?)(?=###|$)', re.DOTALL)
+
 
 class ArchitectureType(str, Enum):
     """Detected architecture patterns"""
@@ -323,13 +328,12 @@ Begin your analysis now."""
             system_type = ArchitectureType.SERVERLESS
         
         # Extract diagram (between ```mermaid and ```)
-        import re
-        diagram_match = re.search(r'```mermaid\n(.*?)\n```', content, re.DOTALL)
+        diagram_match = _MERMAID_RE.search(content)
         if diagram_match:
             architecture_diagram = diagram_match.group(1)
         
         # Extract components (simplified - looks for ### Component: patterns)
-        component_matches = re.findall(r'### Component: (.*?)\n(.*?)(?=###|$)', content, re.DOTALL)
+        component_matches = _COMPONENT_RE.findall(content)
         
         for name, details in component_matches:
             component_data = {
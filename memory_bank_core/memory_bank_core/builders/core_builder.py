@@ -3,19 +3,169 @@ Core Memory Bank Builder
 Extracted from backend to be reusable standalone
 """
 
+import heapq
 import json
 import logging
+import os
+import re
+import stat
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import asyncio
 from claude_code_sdk import query, ClaudeCodeOptions
-from claude_code_sdk.types import SystemMessage
+from claude_code_sdk.types import SystemMessage, TextBlock, ToolUseBlock
 
 from ..models.build_job import BuildConfig, BuildResult, BuildMode
 
 logger = logging.getLogger(__name__)
 
+# File header of each per-file section in a unified git diff; the paths are
+# split out by _diff_header_path since they may contain spaces
+_DIFF_HEADER_RE = re.compile(rb'^diff --git (.+)$', re.MULTILINE)
+
+# Leading C-style quoted path, as git writes paths with unusual characters
+_QUOTED_PATH_RE = re.compile(rb'"((?:[^"\\]|\\.)*)"')
+
+# Hunk header with the old and new line counts (omitted when 1)
+_HUNK_HEADER_RE = re.compile(rb'^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@')
+
+
+# Diffs larger than this (in bytes) are summarized per file in the incremental
+# prompt instead of being embedded verbatim
+MAX_PROMPT_DIFF = 200_000
+
+# Most files listed individually in such a summary (those with the most changed lines)
+MAX_SUMMARY_FILES = 500
+
+
+def _diff_header_path(paths: bytes) -> str:
+    """Extract the a-side path from the 'a/<path> b/<path>' part of a diff header"""
+    quoted = _QUOTED_PATH_RE.match(paths)
+    if quoted:
+        # Git quotes paths with unusual characters, C-style (octal UTF-8 bytes)
+        path = quoted.group(1).decode("unicode_escape").encode("latin-1")
+    else:
+        # Unless the file was renamed both sides name the same path, so the
+        # split point follows from the length even when the path has spaces
+        half = (len(paths) - 1) // 2
+        if paths[half:half + 3] == b" b/" and paths[2:half] == paths[half + 3:]:
+            path = paths[:half]
+        else:
+            path = paths.rpartition(b" b/")[0] or paths
+    if path.startswith(b"a/"):
+        path = path[2:]
+    return path.decode(errors="replace")
+
+
+def _diff_changed_files(git_diff: bytes) -> List[str]:
+    """List the files touched by a git diff, in diff order"""
+    return [_diff_header_path(paths) for paths in _DIFF_HEADER_RE.findall(git_diff)]
+
+
+def _count_hunk_lines(section: bytes) -> Tuple[int, int]:
+    """
+    Count added and removed lines in one file's section of a git diff
+    
+    Only lines inside hunks are counted, using the line counts from each
+    hunk header, so content such as '-- SQL comment' or '++ counter' lines
+    is never mistaken for the ---/+++ file headers.
+    
+    Returns:
+        Tuple of (added lines, removed lines)
+    """
+    added = removed = 0
+    old_left = new_left = 0
+    for line in section.split(b"\n"):
+        if old_left > 0 or new_left > 0:
+            tag = line[:1]
+            if tag == b"+":
+                added += 1
+                new_left -= 1
+            elif tag == b"-":
+                removed += 1
+                old_left -= 1
+            elif tag != b"\\":  # "\ No newline at end of file" is not a line
+                old_left -= 1
+                new_left -= 1
+            continue
+        
+        hunk = _HUNK_HEADER_RE.match(line)
+        if hunk:
+            old_left = int(hunk.group(1) or 1)
+            new_left = int(hunk.group(2) or 1)
+    return added, removed
+
+
+def _summarize_diff(git_diff: bytes, max_files: int = MAX_SUMMARY_FILES) -> str:
+    """
+    Summarize a git diff as one line of added/removed line counts per file
+    
+    At most max_files files are listed - the ones with the most changed
+    lines, kept in diff order - followed by a single line totalling the rest,
+    so the summary stays bounded however many files the diff touches.
+    """
+    headers = list(_DIFF_HEADER_RE.finditer(git_diff))
+    counts = []
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(git_diff)
+        added, removed = _count_hunk_lines(git_diff[header.end():end])
+        counts.append((header.group(1), added, removed))
+    
+    shown = set(heapq.nlargest(max_files, range(len(counts)), key=lambda i: counts[i][1] + counts[i][2]))
+    lines = [
+        f"- {_diff_header_path(paths)}: +{added} -{removed}"
+        for index, (paths, added, removed) in enumerate(counts)
+        if index in shown
+    ]
+    if len(counts) > len(shown):
+        rest = [count for index, count in enumerate(counts) if index not in shown]
+        lines.append(
+            f"- ... and {len(rest)} more files "
+            f"(+{sum(added for _, added, _ in rest)} -{sum(removed for _, _, removed in rest)})"
+        )
+    return "\n".join(lines)
+
+
+def _make_progress_emitter(
+    progress_callback: Optional[Callable]
+) -> Tuple[Callable[[Optional[str]], None], Optional[asyncio.Task]]:
+    """
+    Decouple progress reporting from the build coroutine
+    
+    Messages are pushed onto an asyncio.Queue by a non-blocking emit function
+    and delivered in order to the user callback by a dedicated drain task.
+    Sync callbacks run in a worker thread so blocking work cannot stall the build.
+    Emitting None stops the drain task once all queued messages are delivered.
+    
+    Args:
+        progress_callback: Optional sync or async callback for progress updates
+        
+    Returns:
+        Tuple of (emit function, drain task or None when there is no callback)
+    """
+    if progress_callback is None:
+        return (lambda message: None), None
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    is_async = asyncio.iscoroutinefunction(progress_callback)
+    
+    async def drain():
+        while True:
+            message = await queue.get()
+            if message is None:
+                return
+            try:
+                if is_async:
+                    await progress_callback(message)
+                else:
+                    await asyncio.to_thread(progress_callback, message)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+    
+    return queue.put_nowait, asyncio.create_task(drain())
+
 
 class CoreMemoryBankBuilder:
     """Builds memory banks using Claude Code SDK"""
@@ -49,10 +199,12 @@ class CoreMemoryBankBuilder:
         """
         repo_path = Path(config.repo_path).resolve()
         
-        # Validate repository path
-        if not repo_path.exists():
+        # Validate repository path with a single stat
+        try:
+            repo_stat = repo_path.stat()
+        except OSError:
             raise ValueError(f"Repository path does not exist: {repo_path}")
-        if not repo_path.is_dir():
+        if not stat.S_ISDIR(repo_stat.st_mode):
             raise ValueError(f"Repository path is not a directory: {repo_path}")
             
         # Use the explicit output path from config
@@ -65,68 +217,94 @@ class CoreMemoryBankBuilder:
         tasks_dir = memory_bank_dir / "tasks"
         tasks_dir.mkdir(exist_ok=True)
         
-        await self._call_progress_callback(progress_callback, "Setting up directories and loading system prompt...")
+        emit, drain_task = _make_progress_emitter(progress_callback)
+        
+        try:
+            emit("Setting up directories and loading system prompt...")
             
-        # Load system prompt
-        system_prompt = self._load_system_prompt(config.system_prompt_path)
+            # Load system prompt
+            system_prompt = self._load_system_prompt(config.system_prompt_path)
         
-        # Check for incremental update
-        git_diff_file = repo_path / "git.diff"
-        is_incremental = git_diff_file.exists() or config.mode == BuildMode.INCREMENTAL
+            # Check for incremental update
+            git_diff_file = repo_path / "git.diff"
+            has_git_diff = git_diff_file.exists()
+            is_incremental = has_git_diff or config.mode == BuildMode.INCREMENTAL
         
-        if is_incremental and git_diff_file.exists():
-            await self._call_progress_callback(progress_callback, f"Found git diff - running incremental update")
-            prompt = self._create_incremental_prompt(system_prompt, git_diff_file, memory_bank_dir)
-            mode = "incremental_update"
-        else:
-            await self._call_progress_callback(progress_callback, "Running full memory bank build")
-            prompt = self._create_full_build_prompt(system_prompt, memory_bank_dir)
-            mode = "full_build"
+            if is_incremental and has_git_diff:
+                git_diff = git_diff_file.read_bytes()
+                changed_files = _diff_changed_files(git_diff)
+                emit(f"Found git diff - running incremental update ({len(changed_files)} files changed)")
+                if len(git_diff) > MAX_PROMPT_DIFF:
+                    emit(f"Git diff exceeds {MAX_PROMPT_DIFF} bytes - summarizing it per file in the prompt")
+                prompt = self._create_incremental_prompt(
+                    system_prompt, git_diff_file, git_diff, changed_files, memory_bank_dir
+                )
+                mode = "incremental_update"
+            else:
+                emit("Running full memory bank build")
+                prompt = self._create_full_build_prompt(system_prompt, memory_bank_dir)
+                mode = "full_build"
             
-        await self._call_progress_callback(progress_callback, f"Starting {mode}...")
+            emit(f"Starting {mode}...")
             
-        # Build the memory bank with restart logic
-        try:
-            files_written = await self._execute_claude_build_with_restart(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                repo_path=repo_path,
-                progress_callback=progress_callback,
-                config=config
-            )
+            # Build the memory bank with restart logic
+            try:
+                files_written = await self._execute_claude_build_with_restart(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    repo_path=repo_path,
+                    progress_callback=emit,
+                    config=config
+                )
             
-            # Create metadata files
-            await self._create_metadata_files(
-                output_path=output_path,
-                repo_path=repo_path,
-                files_written=files_written,
-                mode=mode
-            )
+                # Create metadata files
+                await self._create_metadata_files(
+                    output_path=output_path,
+                    repo_path=repo_path,
+                    files_written=files_written,
+                    mode=mode
+                )
             
-            await self._call_progress_callback(progress_callback, "Memory bank building completed successfully!")
+                emit("Memory bank building completed successfully!")
                 
-            return BuildResult(
-                success=True,
-                output_path=str(output_path),
-                files_written=files_written,
-                metadata={
-                    "mode": mode,
-                    "repo_path": str(repo_path),
-                    "generated_at": datetime.now().isoformat()
-                }
-            )
+                return BuildResult(
+                    success=True,
+                    output_path=str(output_path),
+                    files_written=files_written,
+                    metadata={
+                        "mode": mode,
+                        "repo_path": str(repo_path),
+                        "generated_at": datetime.now().isoformat()
+                    }
+                )
             
-        except Exception as e:
-            logger.error(f"Error during memory bank generation: {e}")
-            await self._call_progress_callback(progress_callback, f"Error: {e}")
+            except Exception as e:
+                logger.error(f"Error during memory bank generation: {e}")
+                emit(f"Error: {e}")
                 
-            return BuildResult(
-                success=False,
-                output_path=str(output_path),
-                files_written=[],
-                metadata={},
-                errors=[str(e)]
-            )
+                return BuildResult(
+                    success=False,
+                    output_path=str(output_path),
+                    files_written=[],
+                    metadata={},
+                    errors=[str(e)]
+                )
+        except BaseException as e:
+            if not isinstance(e, Exception) and drain_task is not None:
+                # Cancelled: stop delivering progress rather than waiting for
+                # every queued message to reach the callback
+                drain_task.cancel()
+                drain_task = None
+            raise
+        finally:
+            # Flush queued progress messages before returning
+            if drain_task is not None:
+                emit(None)
+                try:
+                    await drain_task
+                except asyncio.CancelledError:
+                    drain_task.cancel()
+                    raise
     
     def _load_system_prompt(self, custom_path: Optional[str] = None) -> str:
         """Load the system prompt for Claude Code"""
@@ -146,17 +324,37 @@ class CoreMemoryBankBuilder:
             logger.error(f"Error reading system prompt: {e} - using fallback")
             return "Analyze this codebase and create a comprehensive memory bank."
     
-    def _create_incremental_prompt(self, system_prompt: str, git_diff_file: Path, memory_bank_dir: Path) -> str:
+    def _create_incremental_prompt(
+        self,
+        system_prompt: str,
+        git_diff_file: Path,
+        git_diff: bytes,
+        changed_files: List[str],
+        memory_bank_dir: Path
+    ) -> str:
         """Create prompt for incremental update"""
-        git_diff_content = git_diff_file.read_text()
-        return f"""{system_prompt}
+        if len(git_diff) > MAX_PROMPT_DIFF:
+            # Embedding a huge diff bloats the context; list per-file counts and
+            # let Claude read the relevant sections of the diff file itself
+            git_changes = f"""The diff is too large to include here ({len(git_diff)} bytes). Lines added/removed per file:
+{_summarize_diff(git_diff)}
 
-INCREMENTAL UPDATE MODE: A git.diff file was found in the repository.
+The full diff is at {git_diff_file} - read the sections for the files that matter for each memory bank update."""
+        else:
+            changed_files_list = "\n".join(f"- {file_name}" for file_name in changed_files) or "- (none detected)"
+            git_changes = f"""Files changed in the diff:
+{changed_files_list}
 
 Git changes:
 ```diff
-{git_diff_content}
-```
+{git_diff.decode(errors="replace")}
+```"""
+        
+        return f"""{system_prompt}
+
+INCREMENTAL UPDATE MODE: A git.diff file was found in the repository.
+
+{git_changes}
 
 TASK:
 1. First, read the existing memory bank files at {memory_bank_dir} to understand the current state
@@ -325,10 +523,16 @@ Analyze the codebase thoroughly before writing. Each file should contain compreh
         
         # Check what files already exist
         existing_files = []
-        if memory_bank_dir.exists():
-            for file_path in memory_bank_dir.rglob("*.md"):
-                if file_path.is_file() and file_path.stat().st_size > 0:
-                    existing_files.append(str(file_path.relative_to(memory_bank_dir)))
+        for dir_path, _, file_names in os.walk(memory_bank_dir):
+            for file_name in file_names:
+                if not file_name.endswith(".md"):
+                    continue
+                file_path = os.path.join(dir_path, file_name)
+                try:
+                    if os.path.getsize(file_path) > 0:
+                        existing_files.append(os.path.relpath(file_path, memory_bank_dir))
+                except OSError:
+                    continue  # Broken symlink or file removed mid-walk
         
         if len(existing_files) > 0:
             continuation_prompt = f"""CONTINUATION ATTEMPT {attempt}: The previous conversation was cut short, but some files were already created.
@@ -379,9 +583,10 @@ IMPORTANT: This is attempt {attempt} - please work efficiently to create the cor
         
         # Determine permission mode
         permission_mode = config.permission_mode if config else "bypassPermissions"
-        print("--------------------------------")
-        print(system_prompt)
-        print("--------------------------------")
+        # The system prompt dump is only useful to a human watching the terminal;
+        # skip formatting it when stdout is piped (e.g. the job worker)
+        if sys.stdout.isatty():
+            sys.stdout.write(f"--------------------------------\n{system_prompt}\n--------------------------------\n")
         options = ClaudeCodeOptions(
             max_turns=max_turns,
             system_prompt=system_prompt,
@@ -418,14 +623,14 @@ IMPORTANT: This is attempt {attempt} - please work efficiently to create the cor
                     if isinstance(content, list):
                         for block in content:
                             # Log text messages
-                            if hasattr(block, 'text'):
+                            if isinstance(block, TextBlock):
                                 text = block.text
                                 if text.strip():
                                     preview = text[:100] + "..." if len(text) > 100 else text
                                     await self._call_progress_callback(progress_callback, f"[TURN {message_count}] Claude: {preview}")
                             
                             # Track tool usage
-                            elif hasattr(block, 'name') and hasattr(block, 'input'):
+                            elif isinstance(block, ToolUseBlock):
                                 tool_name = block.name
                                 tool_input = block.input
                                 
@@ -474,7 +679,6 @@ IMPORTANT: This is attempt {attempt} - please work efficiently to create the cor
                 # Log SDK version for debugging
                 try:
                     import claude_code_sdk
-                    print("as")
                     version = getattr(claude_code_sdk, '__version__', 'unknown')
                     await self._call_progress_callback(progress_callback, f"[DEBUG] Claude Code SDK version: {version}")
                 except:
@@ -10,7 +10,7 @@ This builder implements the multi-phase agent system:
 import json
 import logging
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable
 
@@ -250,18 +250,20 @@ class MultiAgentMemoryBankBuilder:
             return None
             
         try:
-            # Get recent session usage (last hour to capture this build)
-            recent_analysis = self.session_parser.analyze_recent_usage(
+            # Get recent session usage (last hour to capture this build); session
+            # parsing is blocking file I/O, so keep it off the event loop
+            end_time = datetime.now(timezone.utc)
+            sessions = await asyncio.to_thread(
+                self.session_parser.get_project_token_usage,
                 project_path=project_path,
-                hours=1,  # Look at just the last hour for this build
-                model=self.cost_calculator.model
+                time_filter=(end_time - timedelta(hours=1), end_time)
             )
             
-            if recent_analysis["sessions"] > 0:
-                # Add recent session tokens to calculator
+            if sessions:
+                # Record the sessions as one aggregated build operation
                 self.cost_calculator.add_token_usage(
-                    input_tokens=recent_analysis["total_input_tokens"],
-                    output_tokens=recent_analysis["total_output_tokens"],
+                    input_tokens=sum(s.total_input_tokens + s.cache_creation_tokens for s in sessions),
+                    output_tokens=sum(s.total_output_tokens for s in sessions),
                     operation_name="multi_agent_build",
                     component_name=None
                 )
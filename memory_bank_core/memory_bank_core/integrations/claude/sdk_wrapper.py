@@ -3,15 +3,29 @@ Claude Code SDK wrapper implementation
 """
 
 import logging
+import re
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
+try:
+    from claude_code_sdk import query, ClaudeCodeOptions, TextBlock, ToolUseBlock
+    CLAUDE_SDK_AVAILABLE = True
+except ImportError:
+    query = ClaudeCodeOptions = TextBlock = ToolUseBlock = None
+    CLAUDE_SDK_AVAILABLE = False
+
 from .interface import ClaudeIntegration
 from ...interfaces.builder import BuildProgressCallback
 from ...exceptions.build import ClaudeIntegrationError
 
 logger = logging.getLogger(__name__)
 
+# Lines of Claude output that mark a key decision point
+_ANALYSIS_KEYWORDS_RE = re.compile(
+    r"analyzing|found|creating|updating|exploring|understanding",
+    re.IGNORECASE
+)
+
 
 class ClaudeCodeSDKWrapper(ClaudeIntegration):
     """Wrapper for Claude Code SDK"""
@@ -22,12 +36,9 @@ class ClaudeCodeSDKWrapper(ClaudeIntegration):
     
     def _check_sdk_availability(self) -> bool:
         """Check if Claude Code SDK is available"""
-        try:
-            from claude_code_sdk import query, ClaudeCodeOptions, Message
-            return True
-        except ImportError:
+        if not CLAUDE_SDK_AVAILABLE:
             logger.warning("Claude Code SDK not available")
-            return False
+        return CLAUDE_SDK_AVAILABLE
     
     async def execute_build(
         self,
@@ -40,11 +51,6 @@ class ClaudeCodeSDKWrapper(ClaudeIntegration):
         if not self._sdk_available:
             raise ClaudeIntegrationError("Claude Code SDK is not available")
         
-        try:
-            from claude_code_sdk import query, ClaudeCodeOptions, Message
-        except ImportError as e:
-            raise ClaudeIntegrationError(f"Failed to import Claude Code SDK: {e}")
-        
         # Configure Claude Code options
         options = ClaudeCodeOptions(
             max_turns=self.max_turns,
@@ -54,13 +60,13 @@ class ClaudeCodeSDKWrapper(ClaudeIntegration):
             permission_mode="bypassPermissions"
         )
         
-        messages: List[Message] = []
+        message_count = 0
         files_written = []
         
         try:
             # Stream messages from Claude Code
             async for message in query(prompt=prompt, options=options):
-                messages.append(message)
+                message_count += 1
                 
                 # Handle different message types
                 if hasattr(message, 'content'):
@@ -70,7 +76,7 @@ class ClaudeCodeSDKWrapper(ClaudeIntegration):
                     if isinstance(content, list):
                         for block in content:
                             # Log text messages with more detail
-                            if hasattr(block, 'text'):
+                            if isinstance(block, TextBlock):
                                 text = block.text
                                 if text.strip() and progress_callback:
                                     # Capture full text for detailed analysis
@@ -78,7 +84,7 @@ class ClaudeCodeSDKWrapper(ClaudeIntegration):
                                     
                                     # Detect and log key decision points
                                     for line in lines:
-                                        if any(keyword in line.lower() for keyword in ['analyzing', 'found', 'creating', 'updating', 'exploring', 'understanding']):
+                                        if _ANALYSIS_KEYWORDS_RE.search(line):
                                             await progress_callback(f"[ANALYSIS] {line[:200]}")
                                     
                                     # Still provide general preview
@@ -86,7 +92,7 @@ class ClaudeCodeSDKWrapper(ClaudeIntegration):
                                     await progress_callback(f"Claude: {preview}")
                             
                             # Track tool usage with more detail
-                            elif hasattr(block, 'name') and hasattr(block, 'input'):
+                            elif isinstance(block, ToolUseBlock):
                                 tool_name = block.name
                                 tool_input = block.input
                                 
@@ -125,6 +131,7 @@ class ClaudeCodeSDKWrapper(ClaudeIntegration):
                                     if progress_callback:
                                         await progress_callback(f"[TOOL] Using {tool_name} with params: {str(tool_input)[:100]}")
             
+            logger.info(f"Claude build finished after {message_count} messages")
             if progress_callback:
                 await progress_callback(f"Analysis complete. Files written: {len(files_written)}")
                 
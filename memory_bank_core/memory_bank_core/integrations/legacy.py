@@ -3,10 +3,11 @@ Legacy backward compatibility layer for memory bank operations
 Supports fallback to bash scripts during migration period
 """
 
+import asyncio
 import os
 import subprocess
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -68,29 +69,24 @@ class LegacyScriptExecutor:
         if progress_callback:
             await self._call_progress_callback(progress_callback, f"[LEGACY MODE] Executing: {' '.join(cmd)}")
         
-        process = subprocess.run(
-            cmd,
-            cwd=str(self.root_path),
-            capture_output=True,
-            text=True
-        )
+        returncode, stdout, stderr = await self._run_script(cmd)
         
         # Log output through progress callback if available
-        if process.stdout and progress_callback:
-            for line in process.stdout.strip().split('\n'):
+        if stdout and progress_callback:
+            for line in stdout.strip().split('\n'):
                 if line.strip():
                     await self._call_progress_callback(progress_callback, f"LEGACY_BUILD: {line}")
         
-        if process.stderr and progress_callback:
-            for line in process.stderr.strip().split('\n'):
+        if stderr and progress_callback:
+            for line in stderr.strip().split('\n'):
                 if line.strip():
                     await self._call_progress_callback(progress_callback, f"LEGACY_BUILD_ERR: {line}")
         
-        if process.returncode != 0:
+        if returncode != 0:
             raise subprocess.CalledProcessError(
-                process.returncode, 
+                returncode, 
                 cmd, 
-                f"Legacy script failed with return code {process.returncode}"
+                f"Legacy script failed with return code {returncode}"
             )
         
         return {
@@ -138,29 +134,24 @@ class LegacyScriptExecutor:
         if progress_callback:
             await self._call_progress_callback(progress_callback, f"[LEGACY MODE] Executing: {' '.join(cmd)}")
         
-        process = subprocess.run(
-            cmd,
-            cwd=str(self.root_path),
-            capture_output=True,
-            text=True
-        )
+        returncode, stdout, stderr = await self._run_script(cmd)
         
         # Log output through progress callback if available
-        if process.stdout and progress_callback:
-            for line in process.stdout.strip().split('\n'):
+        if stdout and progress_callback:
+            for line in stdout.strip().split('\n'):
                 if line.strip():
                     await self._call_progress_callback(progress_callback, f"LEGACY_UPDATE: {line}")
         
-        if process.stderr and progress_callback:
-            for line in process.stderr.strip().split('\n'):
+        if stderr and progress_callback:
+            for line in stderr.strip().split('\n'):
                 if line.strip():
                     await self._call_progress_callback(progress_callback, f"LEGACY_UPDATE_ERR: {line}")
         
-        if process.returncode != 0:
+        if returncode != 0:
             raise subprocess.CalledProcessError(
-                process.returncode, 
+                returncode, 
                 cmd, 
-                f"Legacy script failed with return code {process.returncode}"
+                f"Legacy script failed with return code {returncode}"
             )
         
         return {
@@ -175,10 +166,25 @@ class LegacyScriptExecutor:
             "errors": []
         }
     
+    async def _run_script(self, cmd: List[str]) -> Tuple[int, str, str]:
+        """
+        Run a legacy script without blocking the event loop
+        
+        Returns:
+            Tuple of (return code, stdout, stderr)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(self.root_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    
     async def _call_progress_callback(self, progress_callback: Optional[Callable], message: str):
         """Helper to handle both sync and async progress callbacks"""
         if progress_callback:
-            import asyncio
             if asyncio.iscoroutinefunction(progress_callback):
                 await progress_callback(message)
             else:
@@ -107,9 +107,13 @@ class DefaultJobValidator(JobValidationInterface):
     async def validate_repository_path(self, repo_path: str) -> None:
         """Validate repository path exists"""
         import os
-        if not os.path.exists(repo_path):
+        import stat
+        # One stat answers both questions
+        try:
+            repo_stat = os.stat(repo_path)
+        except OSError:
             raise ValueError(f"Repository path does not exist: {repo_path}")
-        if not os.path.isdir(repo_path):
+        if not stat.S_ISDIR(repo_stat.st_mode):
             raise ValueError(f"Repository path is not a directory: {repo_path}")
     
     async def validate_memory_bank_exists(self, memory_bank_name: str) -> None:
@@ -14,7 +14,11 @@ from typing import Optional
 
 import click
 
-from .services.job_manager import JobManager
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .models.build_job import BuildJobRequest, BuildJobType, BuildJobStatus
 
 
@@ -26,6 +30,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _run_async(coro):
+    """Run a coroutine on uvloop when it is installed, else on the default loop"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 @click.group()
 @click.option('--root-path', '-r', default='.', 
               help='Root path for memory banks (default: current directory)')
@@ -83,7 +94,7 @@ def build(ctx, repo_path: str, output_name: Optional[str], wait: bool, legacy: b
         click.echo(f"📝 Output name: {output_name}")
     
     # Run the build
-    asyncio.run(_run_build(root_path, str(repo_path), output_name, wait))
+    _run_async(_run_build(root_path, str(repo_path), output_name, wait))
 
 
 @cli.command()
@@ -118,7 +129,7 @@ def update(ctx, repo_path: str, memory_bank_name: str, wait: bool, legacy: bool)
     click.echo(f"📁 Repository: {repo_path}")
     
     # Run the update
-    asyncio.run(_run_update(root_path, str(repo_path), memory_bank_name, wait))
+    _run_async(_run_update(root_path, str(repo_path), memory_bank_name, wait))
 
 
 @cli.command()
@@ -132,24 +143,21 @@ def list(ctx):
     click.echo()
     
     # Find memory bank directories (those containing memory-bank subdirectory)
-    memory_banks = []
-    for item in root_path.iterdir():
-        if item.is_dir():
-            memory_bank_dir = item / "memory-bank"
-            if memory_bank_dir.exists():
-                memory_banks.append(item)
+    # with one glob rather than an is_dir() and exists() check per entry
+    memory_banks = [memory_bank_dir.parent for memory_bank_dir in root_path.glob("*/memory-bank")]
     
     if not memory_banks:
         click.echo("   No memory banks found")
         click.echo("   Use 'memory-bank build <repo_path>' to create one")
         return
     
+    # Collect the listing and write it in one go instead of four echoes per bank
+    lines = []
     for memory_bank in sorted(memory_banks):
         memory_bank_dir = memory_bank / "memory-bank"
         
-        # Check for basic memory bank files
-        files = list(memory_bank_dir.glob("*.md"))
-        file_count = len(files)
+        # Count basic memory bank files (``list`` is shadowed by this command)
+        file_count = sum(1 for _ in memory_bank_dir.glob("*.md"))
         
         # Get modification time
         try:
@@ -159,10 +167,12 @@ def list(ctx):
         except:
             mod_date = "unknown"
         
-        click.echo(f"   📦 {memory_bank.name}")
-        click.echo(f"      Files: {file_count} markdown files")
-        click.echo(f"      Modified: {mod_date}")
-        click.echo()
+        lines.append(f"   📦 {memory_bank.name}")
+        lines.append(f"      Files: {file_count} markdown files")
+        lines.append(f"      Modified: {mod_date}")
+        lines.append("")
+    
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -180,13 +190,14 @@ def worker(ctx, max_jobs: int):
     click.echo()
     
     # Run the worker
-    asyncio.run(_run_worker(root_path, max_jobs))
+    _run_async(_run_worker(root_path, max_jobs))
 
 
 async def _run_build(root_path: Path, repo_path: str, output_name: Optional[str], wait: bool):
     """Run a build job"""
     
-    # Create job manager
+    # Create job manager (imported here so --help and list skip the SDK import)
+    from .services.job_manager import JobManager
     job_manager = JobManager(str(root_path))
     
     # Create job request
@@ -247,7 +258,8 @@ async def _run_build(root_path: Path, repo_path: str, output_name: Optional[str]
 async def _run_update(root_path: Path, repo_path: str, memory_bank_name: str, wait: bool):
     """Run an update job"""
     
-    # Create job manager
+    # Create job manager (imported here so --help and list skip the SDK import)
+    from .services.job_manager import JobManager
     job_manager = JobManager(str(root_path))
     
     # Create job request
@@ -308,7 +320,8 @@ async def _run_update(root_path: Path, repo_path: str, memory_bank_name: str, wa
 async def _run_worker(root_path: Path, max_jobs: int):
     """Run a persistent worker"""
     
-    # Create job manager
+    # Create job manager (imported here so --help and list skip the SDK import)
+    from .services.job_manager import JobManager
     job_manager = JobManager(str(root_path), max_concurrent_jobs=max_jobs)
     
     try:
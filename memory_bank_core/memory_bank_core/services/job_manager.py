@@ -4,6 +4,10 @@ Extracted from backend to be reusable standalone
 """
 
 import asyncio
+import atexit
+import queue
+import sys
+import threading
 import uuid
 import json
 import logging
@@ -31,6 +35,78 @@ from ..integrations.legacy import LegacyScriptExecutor
 logger = logging.getLogger(__name__)
 
 
+# Marks the end of the progress mirror's queue at interpreter exit
+_STOP = object()
+
+
+class _ProgressMirror:
+    """
+    Mirror progress lines to stdout and stderr from a background thread
+    
+    Progress callbacks run on the event loop; writing and flushing both
+    streams there would stall the build on slow consumers. Lines are queued
+    instead and written in batches by a daemon thread. At interpreter exit
+    the writer is told to stop after the queued lines and joined, so nothing
+    queued (or dequeued but not yet written) is lost or reordered.
+    """
+    
+    # Longest wait for the writer to finish at exit
+    CLOSE_TIMEOUT = 2.0
+    
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def write(self, line: str):
+        """Queue a line for both streams, starting the writer on first use"""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="progress-mirror", daemon=True
+                    )
+                    self._thread.start()
+                    atexit.register(self.close)
+        self._queue.put(line)
+    
+    def close(self):
+        """Stop the writer once everything queued so far has been written"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(self.CLOSE_TIMEOUT)
+    
+    def _run(self):
+        while True:
+            lines = [self._queue.get()]
+            # Pick up whatever else arrived meanwhile so each batch is one write
+            try:
+                while True:
+                    lines.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            if _STOP in lines:
+                self._write(lines[:lines.index(_STOP)])
+                return
+            self._write(lines)
+    
+    @staticmethod
+    def _write(lines: List[str]):
+        if not lines:
+            return
+        text = "".join(lines)
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.write(text)
+                stream.flush()
+            except (OSError, ValueError):
+                pass  # Stream closed or detached
+
+
+_progress_mirror = _ProgressMirror()
+
+
 class JobManager:
     """Manages build jobs for memory bank creation and updates"""
     
@@ -198,14 +274,9 @@ class JobManager:
                 job.logs.append(message)
                 logger.info(f"Build progress: {message}")
                 
-                # Write to stdout immediately with explicit flushing for streaming capture
-                import sys
-                sys.stdout.write(f"[BUILD_PROGRESS] {message}\n")
-                sys.stdout.flush()
-                
-                # Also write to stderr as backup for streaming systems that monitor both
-                sys.stderr.write(f"[BUILD_PROGRESS] {message}\n")
-                sys.stderr.flush()
+                # Mirror to stdout (and stderr as backup for streaming systems that
+                # monitor both) off the event loop
+                _progress_mirror.write(f"[BUILD_PROGRESS] {message}\n")
                 
                 # Save logs periodically (every 10 log entries)
                 log_save_counter[0] += 1
@@ -279,14 +350,9 @@ class JobManager:
                 job.logs.append(message)
                 logger.info(f"Update progress: {message}")
                 
-                # Write to stdout immediately with explicit flushing for streaming capture
-                import sys
-                sys.stdout.write(f"[UPDATE_PROGRESS] {message}\n")
-                sys.stdout.flush()
-                
-                # Also write to stderr as backup for streaming systems that monitor both
-                sys.stderr.write(f"[UPDATE_PROGRESS] {message}\n")
-                sys.stderr.flush()
+                # Mirror to stdout (and stderr as backup for streaming systems that
+                # monitor both) off the event loop
+                _progress_mirror.write(f"[UPDATE_PROGRESS] {message}\n")
                 
                 # Save logs periodically (every 10 log entries)
                 log_save_counter[0] += 1
@@ -376,8 +442,14 @@ class JobManager:
 class DefaultJobStorageAdapter(JobStorageInterface):
     """Default filesystem-based job storage adapter"""
     
-    def __init__(self, root_path: Path):
+    def __init__(self, root_path: Path, pretty_json: bool = False):
+        """
+        Args:
+            root_path: Root path for memory banks
+            pretty_json: Indent the JSON job logs instead of writing them compactly
+        """
         self.root_path = Path(root_path)
+        self.pretty_json = pretty_json
     
     async def get_log_file_path(self, job: BuildJob) -> Path:
         """Generate a log file path with session identifier"""
@@ -428,10 +500,14 @@ class DefaultJobStorageAdapter(JobStorageInterface):
             }
             
             # Write logs in both JSON and readable format
-            # JSON format for programmatic access
+            # JSON format for programmatic access (compact by default, since the
+            # file is rewritten every 10 log entries while a job runs)
             json_file_path = log_file_path.with_suffix('.json')
             with open(json_file_path, 'w') as f:
-                json.dump(log_data, f, indent=2)
+                if self.pretty_json:
+                    json.dump(log_data, f, indent=2)
+                else:
+                    json.dump(log_data, f, separators=(',', ':'))
             
             # Human-readable format
             with open(log_file_path, 'w') as f:
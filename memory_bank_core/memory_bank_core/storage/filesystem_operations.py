@@ -3,16 +3,25 @@ File system operations implementation
 """
 
 import json
+import os
 import re
 import aiofiles
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..interfaces.filesystem import FileSystemOperations
 from ..models.memory_bank import MemoryBankFile, Task, ChangelogEntry, GenerationSummary, Graph
 from ..exceptions.storage import FileSystemError
 
+# Summary and graph files can be large; decode them with orjson when available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class FileSystemOperationsImpl(FileSystemOperations):
     """Implementation of file system operations"""
@@ -56,18 +65,21 @@ class FileSystemOperationsImpl(FileSystemOperations):
         files = []
         
         try:
-            for file_path in memory_bank_path.iterdir():
-                if file_path.is_file() and file_path.suffix == ".md":
-                    content = await self.read_file(file_path)
-                    stat = file_path.stat()
-                    
-                    files.append(MemoryBankFile(
-                        name=file_path.name,
-                        path=str(file_path),
-                        content=content,
-                        last_modified=datetime.fromtimestamp(stat.st_mtime),
-                        size=stat.st_size
-                    ))
+            # scandir entries carry their own stat data, so each file is stat'ed once
+            with os.scandir(memory_bank_path) as entries:
+                md_entries = [entry for entry in entries if entry.name.endswith(".md") and entry.is_file()]
+            
+            for entry in md_entries:
+                content = await self.read_file(Path(entry.path))
+                stat = entry.stat()
+                
+                files.append(MemoryBankFile(
+                    name=entry.name,
+                    path=entry.path,
+                    content=content,
+                    last_modified=datetime.fromtimestamp(stat.st_mtime),
+                    size=stat.st_size
+                ))
         except Exception as e:
             raise FileSystemError(f"Failed to parse memory bank files from {memory_bank_path}", str(e))
         
@@ -141,7 +153,7 @@ class FileSystemOperationsImpl(FileSystemOperations):
         
         try:
             content = await self.read_file(summary_path)
-            data = json.loads(content)
+            data = _json_loads(content)
             
             return GenerationSummary(
                 generated_at=datetime.fromisoformat(data['generated_at'].replace('Z', '+00:00')),
@@ -160,7 +172,7 @@ class FileSystemOperationsImpl(FileSystemOperations):
         
         try:
             content = await self.read_file(graph_path)
-            data = json.loads(content)
+            data = _json_loads(content)
             
             return Graph(
                 nodes=data.get('nodes', []),
@@ -2,6 +2,7 @@
 File system storage implementation for memory banks
 """
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -27,13 +28,18 @@ class FileSystemStorage(MemoryBankStorage):
             if not self.root_path.exists():
                 return memory_banks
             
-            for item in self.root_path.iterdir():
-                if item.is_dir() and "memory_bank" in item.name:
-                    memory_bank_path = item / "memory-bank"
-                    if memory_bank_path.exists():
-                        summary = await self._get_memory_bank_summary(item.name, str(item))
-                        if summary:
-                            memory_banks.append(summary)
+            candidates = [item for item in self.root_path.iterdir() if "memory_bank" in item.name]
+            
+            # Validity checks stat the filesystem - run them concurrently off the event loop
+            valid = await asyncio.gather(
+                *(asyncio.to_thread(self._is_memory_bank_dir, item) for item in candidates)
+            )
+            
+            summaries = await asyncio.gather(
+                *(self._get_memory_bank_summary(item.name, str(item))
+                  for item, is_valid in zip(candidates, valid) if is_valid)
+            )
+            memory_banks.extend(summary for summary in summaries if summary)
         except Exception as e:
             raise StorageAccessError(f"Failed to list memory banks", str(e))
         
@@ -42,7 +48,9 @@ class FileSystemStorage(MemoryBankStorage):
     async def get_memory_bank(self, name: str) -> Optional[MemoryBank]:
         """Get a specific memory bank by name"""
         memory_bank_dir = self.root_path / name
-        if not memory_bank_dir.exists():
+        try:
+            dir_stat = memory_bank_dir.stat()
+        except OSError:
             return None
         
         memory_bank_path = memory_bank_dir / "memory-bank"
@@ -50,11 +58,14 @@ class FileSystemStorage(MemoryBankStorage):
             return None
         
         try:
-            files = await self.fs_ops.parse_memory_bank_files(memory_bank_path)
-            tasks = await self.fs_ops.parse_tasks(memory_bank_path / "tasks")
-            changelog = await self.fs_ops.parse_changelog(memory_bank_path / "changelog.md")
-            generation_summary = await self.fs_ops.parse_generation_summary(memory_bank_dir / "generation_summary.json")
-            graph = await self.fs_ops.parse_graph(memory_bank_dir / "graph.json")
+            # The parts of a memory bank are independent files; read them concurrently
+            files, tasks, changelog, generation_summary, graph = await asyncio.gather(
+                self.fs_ops.parse_memory_bank_files(memory_bank_path),
+                self.fs_ops.parse_tasks(memory_bank_path / "tasks"),
+                self.fs_ops.parse_changelog(memory_bank_path / "changelog.md"),
+                self.fs_ops.parse_generation_summary(memory_bank_dir / "generation_summary.json"),
+                self.fs_ops.parse_graph(memory_bank_dir / "graph.json")
+            )
             
             return MemoryBank(
                 name=name,
@@ -64,8 +75,8 @@ class FileSystemStorage(MemoryBankStorage):
                 changelog=changelog,
                 generation_summary=generation_summary,
                 graph=graph,
-                created_at=datetime.fromtimestamp(memory_bank_dir.stat().st_ctime),
-                updated_at=datetime.fromtimestamp(memory_bank_dir.stat().st_mtime)
+                created_at=datetime.fromtimestamp(dir_stat.st_ctime),
+                updated_at=datetime.fromtimestamp(dir_stat.st_mtime)
             )
         except Exception as e:
             raise StorageAccessError(f"Failed to load memory bank {name}", str(e))
@@ -96,6 +107,11 @@ class FileSystemStorage(MemoryBankStorage):
             return str(memory_bank_dir)
         return None
     
+    @staticmethod
+    def _is_memory_bank_dir(path: Path) -> bool:
+        """Check whether a directory contains a memory-bank subdirectory"""
+        return path.is_dir() and (path / "memory-bank").exists()
+    
     async def _get_memory_bank_summary(self, name: str, path: str) -> Optional[MemoryBankSummary]:
         """Get summary information for a memory bank"""
         memory_bank_path = Path(path) / "memory-bank"
@@ -3,9 +3,10 @@ Test script for Architecture Agent - Phase 1 testing
 """
 
 import asyncio
+import atexit
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -20,15 +21,38 @@ async def test_architecture_agent():
     
     # Use the pc_cortex repo itself as a test case
     repo_path = Path(__file__).parent.parent.parent  # pc_cortex root
-    output_path = repo_path / "test_output" / f"architecture_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    # Millisecond stamp so quick reruns don't share (and overwrite) an output directory
+    stamp = time.time_ns() // 1_000_000
+    output_path = repo_path / "test_output" / f"architecture_test_{stamp}"
     
     print(f"Testing Architecture Agent on: {repo_path}")
     print(f"Output will be saved to: {output_path}")
     print("-" * 80)
     
-    # Progress callback to see what's happening
+    # Progress callback to see what's happening; the timestamp is only
+    # reformatted when the wall-clock second changes, and lines are written
+    # in batches (every 16 messages or 100 ms) rather than one print each
+    last_stamp = [-1, ""]  # Use list to modify in closure
+    pending = []
+    last_flush = [time.monotonic()]
+    
+    def flush_progress():
+        if pending:
+            sys.stdout.write("\n".join(pending) + "\n")
+            sys.stdout.flush()
+            pending.clear()
+        last_flush[0] = time.monotonic()
+    
+    atexit.register(flush_progress)
+    
     def progress_callback(message: str):
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        now = int(time.time())
+        if now != last_stamp[0]:
+            last_stamp[0] = now
+            last_stamp[1] = time.strftime('%H:%M:%S', time.localtime(now))
+        pending.append(f"[{last_stamp[1]}] {message}")
+        if len(pending) >= 16 or time.monotonic() - last_flush[0] > 0.1:
+            flush_progress()
     
     # Test using the multi-agent builder
     builder = MultiAgentMemoryBankBuilder(repo_path)
@@ -45,6 +69,7 @@ async def test_architecture_agent():
             config=config,
             progress_callback=progress_callback
         )
+        flush_progress()
         
         print("\n" + "=" * 80)
         print("PHASE 1 RESULTS:")
@@ -67,8 +92,8 @@ async def test_architecture_agent():
                 print("ARCHITECTURE MANIFEST PREVIEW:")
                 print('-' * 80)
                 with open(manifest_path, 'r') as f:
-                    content = f.read()
-                    # Show first 1000 characters
+                    # Show first 1000 characters; one extra tells us whether to truncate
+                    content = f.read(1001)
                     print(content[:1000])
                     if len(content) > 1000:
                         print("\n... (truncated)")
@@ -77,6 +102,7 @@ async def test_architecture_agent():
             print(f"Errors: {result.errors}")
             
     except Exception as e:
+        flush_progress()
         print(f"\n✗ Test failed with error: {e}")
         import traceback
         traceback.print_exc()
@@ -119,8 +145,13 @@ if __name__ == "__main__":
     print("Starting Architecture Agent Phase 1 Testing")
     print("=" * 80)
     
-    # Run the test
-    asyncio.run(test_architecture_agent())
+    # Run the test (on uvloop when it is installed)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(test_architecture_agent())
+    else:
+        uvloop.run(test_architecture_agent())
     
     # Optionally run direct test
     # asyncio.run(test_direct_architecture_agent())
\ No newline at end of file
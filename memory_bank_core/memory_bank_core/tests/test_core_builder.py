@@ -0,0 +1,227 @@
+"""
+Tests for the core builder's git diff helpers and progress emitter
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from memory_bank_core.builders.core_builder import (
+    MAX_PROMPT_DIFF,
+    MAX_SUMMARY_FILES,
+    CoreMemoryBankBuilder,
+    _diff_changed_files,
+    _make_progress_emitter,
+    _summarize_diff,
+)
+from memory_bank_core.models.build_job import BuildConfig
+
+# Output of `git diff` for a quoted (non-ASCII) path, a path with a space
+# whose content lines start with '--' and '++', and a file losing its final
+# newline
+GIT_DIFF = b"""\
+diff --git "a/caf\\303\\251.txt" "b/caf\\303\\251.txt"
+index 7898192..6178079 100644
+--- "a/caf\\303\\251.txt"
++++ "b/caf\\303\\251.txt"
+@@ -1 +1 @@
+-a
++b
+diff --git a/my query.sql b/my query.sql
+index 635e6df..1a98418 100644
+--- a/my query.sql\t
++++ b/my query.sql\t
+@@ -1,3 +1,4 @@
+ select 1;
+--- old comment
+-select 2;
++-- new comment
++++ weird
++select 3;
+diff --git a/noeol.txt b/noeol.txt
+index 814f4a4..7279b45 100644
+--- a/noeol.txt
++++ b/noeol.txt
+@@ -1,2 +1,2 @@
+ one
+-two
++three
+\\ No newline at end of file
+diff --git a/plain.py b/plain.py
+index 7d4290a..8e6ee4c 100644
+--- a/plain.py
++++ b/plain.py
+@@ -1 +1,2 @@
+-x = 1
++x = 2
++y = 3
+"""
+
+
+def test_changed_files_keep_full_paths():
+    assert _diff_changed_files(GIT_DIFF) == ["café.txt", "my query.sql", "noeol.txt", "plain.py"]
+
+
+def test_changed_files_of_renamed_file():
+    git_diff = b"diff --git a/old name.py b/new name.py\nsimilarity index 100%\n"
+
+    assert _diff_changed_files(git_diff) == ["old name.py"]
+
+
+def test_summary_counts_only_hunk_lines():
+    # Matches `git diff --numstat` for the same change
+    assert _summarize_diff(GIT_DIFF).splitlines() == [
+        "- café.txt: +1 -1",
+        "- my query.sql: +3 -2",
+        "- noeol.txt: +1 -1",
+        "- plain.py: +2 -1",
+    ]
+
+
+def test_summary_counts_several_hunks():
+    git_diff = b"""\
+diff --git a/a.txt b/a.txt
+--- a/a.txt
++++ b/a.txt
+@@ -1,2 +1,2 @@
+-1
++one
+ 2
+@@ -10,2 +10,3 @@
+ 10
++--- not a header
+ 11
+"""
+
+    assert _summarize_diff(git_diff) == "- a.txt: +2 -1"
+
+
+
+def test_summary_lists_largest_files_up_to_cap():
+    assert _summarize_diff(GIT_DIFF, max_files=2).splitlines() == [
+        "- my query.sql: +3 -2",
+        "- plain.py: +2 -1",
+        "- ... and 2 more files (+2 -2)",
+    ]
+
+
+def many_file_diff(count):
+    """A diff touching count files, each with one changed line"""
+    return b"".join(
+        b"diff --git a/src/module_%d.py b/src/module_%d.py\n"
+        b"--- a/src/module_%d.py\n+++ b/src/module_%d.py\n"
+        b"@@ -1 +1 @@\n-old = %d\n+new = %d\n" % ((index,) * 6)
+        for index in range(count)
+    )
+
+
+def test_incremental_prompt_for_huge_diff_is_bounded(tmp_path):
+    git_diff = many_file_diff(20_000)
+    assert len(git_diff) > MAX_PROMPT_DIFF
+    builder = CoreMemoryBankBuilder(tmp_path)
+
+    prompt = builder._create_incremental_prompt(
+        "system", tmp_path / "git.diff", git_diff, _diff_changed_files(git_diff), tmp_path / "memory-bank"
+    )
+
+    summary = _summarize_diff(git_diff)
+    hidden = 20_000 - MAX_SUMMARY_FILES
+    assert len(summary.splitlines()) == MAX_SUMMARY_FILES + 1
+    assert summary.endswith(f"- ... and {hidden} more files (+{hidden} -{hidden})")
+    assert summary in prompt
+    assert len(prompt) < MAX_PROMPT_DIFF // 4
+
+
+def run_emitter(callback, messages):
+    """Emit messages through a progress emitter and wait for delivery"""
+    async def main():
+        emit, drain_task = _make_progress_emitter(callback)
+        for message in messages:
+            emit(message)
+        emit(None)
+        await drain_task
+
+    asyncio.run(main())
+
+
+def test_emitter_delivers_in_order_to_async_callback():
+    received = []
+
+    async def callback(message):
+        await asyncio.sleep(0)
+        received.append(message)
+
+    run_emitter(callback, [f"step {index}" for index in range(20)])
+
+    assert received == [f"step {index}" for index in range(20)]
+
+
+def test_emitter_runs_sync_callback_off_the_loop():
+    received = []
+    loop_thread = threading.get_ident()
+
+    def callback(message):
+        received.append((message, threading.get_ident() != loop_thread))
+
+    run_emitter(callback, ["a", "b", "c"])
+
+    assert received == [("a", True), ("b", True), ("c", True)]
+
+
+def test_emitter_survives_failing_callback():
+    received = []
+
+    def callback(message):
+        if message == "bad":
+            raise RuntimeError("callback failed")
+        received.append(message)
+
+    run_emitter(callback, ["before", "bad", "after"])
+
+    assert received == ["before", "after"]
+
+
+def test_emitter_without_callback():
+    emit, drain_task = _make_progress_emitter(None)
+
+    emit("ignored")
+
+    assert drain_task is None
+
+
+def test_cancelled_build_does_not_wait_for_queued_progress(tmp_path, monkeypatch):
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    builder = CoreMemoryBankBuilder(tmp_path)
+    delivered = []
+
+    async def slow_callback(message):
+        await asyncio.sleep(0.5)
+        delivered.append(message)
+
+    async def hanging_build(progress_callback, **kwargs):
+        for index in range(10):
+            progress_callback(f"step {index}")
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(builder, "_execute_claude_build_with_restart", hanging_build)
+    config = BuildConfig(repo_path=str(repo_path), output_path=str(tmp_path / "out"))
+
+    async def main():
+        tasks_before = asyncio.all_tasks()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                builder.build_memory_bank(config, progress_callback=slow_callback), 0.2
+            )
+        # Let the cancelled drain task finish unwinding
+        await asyncio.sleep(0)
+        return [task for task in asyncio.all_tasks() - tasks_before if not task.done()]
+
+    started = time.monotonic()
+    leftover = asyncio.run(main())
+
+    assert time.monotonic() - started < 1.0
+    assert leftover == []
+    assert len(delivered) < 10
@@ -0,0 +1,32 @@
+"""
+Tests for the cost calculator
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from memory_bank_core.utils import cost_calculator
+from memory_bank_core.utils.cost_calculator import CostCalculator, ClaudeModel
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_cost_report_serializes_non_json_metadata(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(cost_calculator, "orjson", None)
+    calculator = CostCalculator(ClaudeModel.CLAUDE_4_SONNET)
+    calculator.add_token_usage(1000, 200, "architecture_analysis")
+    started = datetime(2025, 1, 1, 12, 30)
+
+    report_path = calculator.save_cost_report(
+        tmp_path, build_metadata={"started": started, "repo": Path("/repo")}
+    )
+
+    report = json.loads(report_path.read_text())
+    assert report["build_metadata"]["started"] == started.isoformat()
+    assert report["build_metadata"]["repo"] == "/repo"
+    assert report["cost_analysis"]["token_usage"]["total_tokens"] == 1200
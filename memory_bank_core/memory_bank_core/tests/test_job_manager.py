@@ -0,0 +1,65 @@
+"""
+Tests for the job manager's progress mirror
+"""
+
+import io
+import sys
+import threading
+import time
+
+from memory_bank_core.services.job_manager import _ProgressMirror
+
+
+class SlowStream(io.StringIO):
+    """Stream whose writes take a while, so batches are still in flight"""
+
+    def write(self, text):
+        time.sleep(0.02)
+        return super().write(text)
+
+
+def test_close_writes_every_line_in_order(monkeypatch):
+    stdout, stderr = SlowStream(), SlowStream()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    monkeypatch.setattr(sys, "stderr", stderr)
+    mirror = _ProgressMirror()
+    lines = [f"line {index}\n" for index in range(50)]
+
+    for line in lines:
+        mirror.write(line)
+    mirror.close()
+
+    assert not mirror._thread.is_alive()
+    assert stdout.getvalue() == "".join(lines)
+    assert stderr.getvalue() == "".join(lines)
+
+
+def test_close_without_writes():
+    mirror = _ProgressMirror()
+
+    mirror.close()
+
+    assert mirror._thread is None
+
+
+def test_close_with_concurrent_writers(monkeypatch):
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    monkeypatch.setattr(sys, "stderr", io.StringIO())
+    mirror = _ProgressMirror()
+
+    def writer(name):
+        for index in range(100):
+            mirror.write(f"{name} {index}\n")
+
+    threads = [threading.Thread(target=writer, args=(name,)) for name in "abc"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    mirror.close()
+
+    written = stdout.getvalue().splitlines()
+    assert len(written) == 300
+    for name in "abc":
+        assert [line for line in written if line.startswith(name)] == [f"{name} {index}" for index in range(100)]
@@ -0,0 +1,59 @@
+"""
+Tests for the multi-agent builder's build cost tracking
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from memory_bank_core.builders.multi_agent_builder import MultiAgentMemoryBankBuilder
+from memory_bank_core.utils.session_parser import SessionTokenUsage
+
+
+class StubSessionParser:
+    """Session parser returning fixed sessions"""
+
+    def __init__(self, sessions):
+        self.sessions = sessions
+
+    def get_project_token_usage(self, project_path, time_filter=None, session_limit=None):
+        return self.sessions
+
+
+def session(session_id, input_tokens, output_tokens, cache_creation_tokens=0):
+    now = datetime.now(timezone.utc)
+    return SessionTokenUsage(
+        session_id=session_id,
+        session_start=now,
+        session_end=now,
+        total_input_tokens=input_tokens,
+        total_output_tokens=output_tokens,
+        cache_creation_tokens=cache_creation_tokens,
+        cache_read_tokens=0,
+        message_count=1,
+        model_used="claude-sonnet-4",
+        working_directory="/repo"
+    )
+
+
+def test_build_cost_is_one_aggregated_operation(tmp_path):
+    builder = MultiAgentMemoryBankBuilder(tmp_path)
+    builder.session_parser = StubSessionParser([
+        session("aaaaaaaa-1", 1000, 200, cache_creation_tokens=50),
+        session("bbbbbbbb-2", 3000, 400),
+    ])
+
+    breakdown = asyncio.run(builder._calculate_build_cost("/repo"))
+
+    assert [detail["operation"] for detail in breakdown.operation_costs] == ["multi_agent_build"]
+    assert breakdown.operation_costs[0]["input_tokens"] == 4050
+    assert breakdown.operation_costs[0]["output_tokens"] == 600
+    assert breakdown.total_input_tokens == 4050
+    assert breakdown.total_output_tokens == 600
+
+
+def test_build_cost_without_sessions(tmp_path):
+    builder = MultiAgentMemoryBankBuilder(tmp_path)
+    builder.session_parser = StubSessionParser([])
+
+    assert asyncio.run(builder._calculate_build_cost("/repo")) is None
+    assert builder.cost_calculator.token_usages == []
@@ -0,0 +1,295 @@
+"""
+Tests for the Claude Code session parser
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from memory_bank_core.utils import session_parser
+from memory_bank_core.utils.cost_calculator import CostCalculator, ClaudeModel
+from memory_bank_core.utils.session_parser import SessionParser, _parse_session_file
+
+
+def write_session(path, records):
+    """Write records as a JSONL session file"""
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+def usage_record(timestamp, input_tokens=10, output_tokens=5, **extra):
+    """Build an assistant record carrying token usage"""
+    return {
+        "type": "assistant",
+        "timestamp": timestamp,
+        "message": {
+            "model": "claude-sonnet-4",
+            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+            **extra
+        }
+    }
+
+
+def test_parse_session_file_totals(tmp_path):
+    session_file = write_session(tmp_path / "abc.jsonl", [
+        {"sessionId": "abc", "cwd": "/repo", "timestamp": "2025-01-01T00:00:00+00:00"},
+        usage_record("2025-01-01T00:01:00+00:00", input_tokens=100, output_tokens=20),
+        {"type": "user", "timestamp": "2025-01-01T00:03:00+00:00"},
+        usage_record("2025-01-01T00:02:00+00:00", input_tokens=50, output_tokens=10),
+    ])
+
+    usage = _parse_session_file(session_file)
+
+    assert usage.session_id == "abc"
+    assert usage.working_directory == "/repo"
+    assert usage.total_input_tokens == 150
+    assert usage.total_output_tokens == 30
+    assert usage.message_count == 2
+    assert usage.model_used == "claude-sonnet-4"
+    assert usage.session_end == datetime(2025, 1, 1, 0, 3, tzinfo=timezone.utc)
+
+
+def test_nested_timestamp_does_not_move_session_end(tmp_path):
+    # A "timestamp" key inside message content must not be taken for the
+    # record's own timestamp
+    session_file = write_session(tmp_path / "abc.jsonl", [
+        {"sessionId": "abc", "timestamp": "2025-01-01T00:00:00+00:00"},
+        {"type": "user", "message": {"content": {"timestamp": "2030-01-01T00:00:00+00:00"}},
+         "timestamp": "2025-01-01T00:01:00+00:00"},
+        usage_record("2025-01-01T00:02:00+00:00",
+                     content=[{"input": {"timestamp": "2030-01-01T00:00:00+00:00"}}]),
+    ])
+
+    usage = _parse_session_file(session_file)
+
+    assert usage.session_end == datetime(2025, 1, 1, 0, 2, tzinfo=timezone.utc)
+
+
+def make_parser(tmp_path, **kwargs):
+    """Build a parser that reads sessions for /repo from tmp_path"""
+    parser = SessionParser(cache_path=tmp_path / "cache" / "sessions.json", **kwargs)
+    parser.claude_projects_dir = tmp_path / "projects"
+    (parser.claude_projects_dir / "-repo").mkdir(parents=True)
+    return parser
+
+
+def test_time_filter_does_not_reopen_cached_sessions(tmp_path, monkeypatch):
+    parser = make_parser(tmp_path, use_cache=True)
+    write_session(parser.claude_projects_dir / "-repo" / "abc.jsonl", [
+        {"sessionId": "abc", "timestamp": "2025-01-01T00:00:00+00:00"},
+        usage_record("2025-01-01T00:01:00+00:00"),
+    ])
+    time_filter = (datetime(2024, 12, 31, tzinfo=timezone.utc), datetime(2025, 1, 2, tzinfo=timezone.utc))
+    assert len(parser.get_project_token_usage("/repo", time_filter=time_filter)) == 1
+
+    def fail(session_file):
+        raise AssertionError(f"cached session {session_file} was reopened")
+
+    monkeypatch.setattr(session_parser, "_read_session_start", fail)
+    monkeypatch.setattr(session_parser, "_parse_session_file", fail)
+
+    usages = parser.get_project_token_usage("/repo", time_filter=time_filter)
+
+    assert [usage.session_id for usage in usages] == ["abc"]
+
+
+def write_sessions(parser, count):
+    """Write count small session files for /repo"""
+    return [
+        write_session(parser.claude_projects_dir / "-repo" / f"s{index}.jsonl", [
+            {"sessionId": f"s{index}", "timestamp": "2025-01-01T00:00:00+00:00"},
+            usage_record("2025-01-01T00:01:00+00:00", input_tokens=index),
+        ])
+        for index in range(count)
+    ]
+
+
+class FailingExecutor:
+    """Stand-in for ProcessPoolExecutor that cannot start workers"""
+
+    def __init__(self, *args, **kwargs):
+        raise OSError("no worker processes")
+
+
+def test_parsing_is_serial_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv(session_parser.SESSION_PARALLEL_ENV, raising=False)
+    parser = make_parser(tmp_path, use_cache=False)
+    session_files = write_sessions(parser, session_parser.PARALLEL_PARSE_THRESHOLD)
+    monkeypatch.setattr(session_parser, "ProcessPoolExecutor", FailingExecutor)
+    logged = []
+    monkeypatch.setattr(session_parser.logger, "warning", logged.append)
+
+    usages = parser.parse_session_files(session_files)
+
+    assert [usage.total_input_tokens for usage in usages] == list(range(len(session_files)))
+    assert logged == []
+    assert not parser.parallel
+
+
+def test_parallel_parsing_enabled_by_environment(monkeypatch):
+    monkeypatch.setenv(session_parser.SESSION_PARALLEL_ENV, "true")
+
+    assert SessionParser().parallel
+    assert not SessionParser(parallel=False).parallel
+
+
+def test_parallel_parsing_falls_back_to_serial(tmp_path, monkeypatch):
+    parser = make_parser(tmp_path, use_cache=False, parallel=True)
+    session_files = write_sessions(parser, session_parser.PARALLEL_PARSE_THRESHOLD)
+    monkeypatch.setattr(session_parser.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(session_parser, "ProcessPoolExecutor", FailingExecutor)
+
+    usages = parser.parse_session_files(session_files)
+
+    assert [usage.total_input_tokens for usage in usages] == list(range(len(session_files)))
+
+
+def test_parallel_parsing_matches_serial(tmp_path, monkeypatch):
+    parser = make_parser(tmp_path, use_cache=False, parallel=True)
+    session_files = write_sessions(parser, session_parser.PARALLEL_PARSE_THRESHOLD)
+    monkeypatch.setattr(session_parser.os, "cpu_count", lambda: 2)
+    logged = []
+    monkeypatch.setattr(session_parser.logger, "warning", logged.append)
+
+    parallel = parser.parse_session_files(session_files)
+    serial = [_parse_session_file(session_file) for session_file in session_files]
+
+    assert parallel == serial
+    assert logged == []
+
+
+def test_cache_is_off_unless_enabled(tmp_path, monkeypatch):
+    monkeypatch.delenv(session_parser.SESSION_CACHE_ENV, raising=False)
+    parser = make_parser(tmp_path)
+    session_file, = write_sessions(parser, 1)
+
+    parser.parse_session_file(session_file)
+
+    assert not parser.use_cache
+    assert not parser.cache_path.exists()
+
+    monkeypatch.setenv(session_parser.SESSION_CACHE_ENV, "true")
+    assert SessionParser().use_cache
+
+
+def test_cache_reused_across_parsers(tmp_path, monkeypatch):
+    parser = make_parser(tmp_path, use_cache=True)
+    session_file, = write_sessions(parser, 1)
+    first = parser.parse_session_file(session_file)
+    assert parser.cache_path.exists()
+
+    monkeypatch.setattr(session_parser, "_parse_session_file", lambda path: None)
+    reloaded = SessionParser(cache_path=parser.cache_path, use_cache=True)
+
+    assert reloaded.parse_session_file(session_file) == first
+
+
+def test_cache_invalidated_by_mtime(tmp_path):
+    parser = make_parser(tmp_path, use_cache=True)
+    session_file, = write_sessions(parser, 1)
+    assert parser.parse_session_file(session_file).total_input_tokens == 0
+
+    # Same size, different content: only the mtime tells the entry is stale
+    session_file.write_text(session_file.read_text().replace('"input_tokens": 0', '"input_tokens": 7'))
+    stat = session_file.stat()
+    os.utime(session_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert parser.parse_session_file(session_file).total_input_tokens == 7
+
+
+def test_cache_invalidated_by_size(tmp_path):
+    parser = make_parser(tmp_path, use_cache=True)
+    session_file, = write_sessions(parser, 1)
+    stat = session_file.stat()
+    assert parser.parse_session_file(session_file).message_count == 1
+
+    # Grow the file but restore its mtime: only the size tells the entry is stale
+    with open(session_file, "a") as f:
+        f.write(json.dumps(usage_record("2025-01-01T00:02:00+00:00")) + "\n")
+    os.utime(session_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert parser.parse_session_file(session_file).message_count == 2
+
+
+def test_cache_keyed_by_path(tmp_path):
+    parser = make_parser(tmp_path, use_cache=True)
+    first, second = write_sessions(parser, 2)
+
+    assert parser.parse_session_file(first).session_id == "s0"
+    assert parser.parse_session_file(second).session_id == "s1"
+
+
+def test_cache_prunes_deleted_sessions(tmp_path):
+    parser = make_parser(tmp_path, use_cache=True)
+    first, second = write_sessions(parser, 2)
+    parser.parse_session_files([first, second])
+
+    first.unlink()
+    third = write_session(first.with_name("s2.jsonl"), [
+        {"sessionId": "s2", "timestamp": "2025-01-01T00:00:00+00:00"},
+    ])
+    parser.parse_session_file(third)
+
+    cached = json.loads(parser.cache_path.read_text())["sessions"]
+    assert sorted(cached) == sorted([str(second), str(third)])
+    assert [path.name for path in parser.cache_path.parent.iterdir()] == [parser.cache_path.name]
+
+
+
+def test_cache_with_other_version_is_discarded(tmp_path):
+    parser = make_parser(tmp_path, use_cache=True)
+    session_file, = write_sessions(parser, 1)
+    stat = session_file.stat()
+    stale_usage = {"session_id": "stale"}
+    for stale in (
+        [],
+        {str(session_file): {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "usage": stale_usage}},
+        {"version": session_parser.SESSION_CACHE_VERSION + 1, "sessions": {}},
+    ):
+        parser.cache_path.parent.mkdir(exist_ok=True)
+        parser.cache_path.write_text(json.dumps(stale))
+        reloaded = SessionParser(cache_path=parser.cache_path, use_cache=True)
+
+        assert reloaded.parse_session_file(session_file).session_id == "s0"
+        assert json.loads(parser.cache_path.read_text())["version"] == session_parser.SESSION_CACHE_VERSION
+
+
+def test_malformed_cache_entry_is_a_miss(tmp_path):
+    parser = make_parser(tmp_path, use_cache=True)
+    first, second, third = write_sessions(parser, 3)
+    stat = first.stat()
+    parser.cache_path.parent.mkdir()
+    parser.cache_path.write_text(json.dumps({
+        "version": session_parser.SESSION_CACHE_VERSION,
+        "sessions": {
+            # Matching stat but fields from an older SessionTokenUsage
+            str(first): {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                         "usage": {"session_id": "old", "tokens": 1}},
+            str(second): ["not", "an", "entry"],
+            str(third): {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                         "usage": {"session_start": "not a date"}},
+        }
+    }))
+    reloaded = SessionParser(cache_path=parser.cache_path, use_cache=True)
+
+    usages = reloaded.parse_session_files([first, second, third])
+
+    assert [usage.session_id for usage in usages] == ["s0", "s1", "s2"]
+
+
+def test_detected_session_cost_matches_calculator(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    project_dir = tmp_path / ".claude" / "projects" / "-repo"
+    project_dir.mkdir(parents=True)
+    write_session(project_dir / "big.jsonl", [
+        {"sessionId": "big", "timestamp": "2025-01-01T00:00:00+00:00"},
+        usage_record("2025-01-01T00:01:00+00:00", input_tokens=60000, output_tokens=9000),
+    ])
+
+    detected, = session_parser.detect_memory_bank_sessions("/repo")
+
+    calculator = CostCalculator(ClaudeModel.CLAUDE_4_SONNET)
+    calculator.add_token_usage(60000, 9000, "session")
+    assert detected["estimated_cost"] == round(calculator.calculate_cost().total_cost, 4)
+    assert detected["likely_memory_bank_session"]
@@ -6,15 +6,29 @@ Calculates API costs based on token usage and Claude model pricing.
 
 import json
 import logging
-from datetime import datetime
+import sys
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _json_default(value: Any) -> str:
+    """Serialize values JSON has no type for, matching orjson for dates"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
 class ClaudeModel(str, Enum):
     """Claude model options with pricing"""
     CLAUDE_4_OPUS = "claude-4-opus"
@@ -45,6 +59,70 @@ CLAUDE_PRICING = {
     ClaudeModel.CLAUDE_3_HAIKU: ModelPricing(0.25, 1.25, "Claude 3 Haiku"),
 }
 
+# Operation-name fragments mapped to the build phase they belong to
+PHASE_MAPPING = {
+    "architecture_analysis": "Phase 1: Architecture",
+    "component_analysis": "Phase 2: Components", 
+    "validation": "Phase 3: Validation"
+}
+
+# Estimated token distribution (roughly 60% input, 40% output)
+ESTIMATE_INPUT_RATIO = 0.6
+ESTIMATE_OUTPUT_RATIO = 0.4
+
+
+# The memoized helpers below are keyed on the per-million rates rather than the
+# model, so models that share pricing (e.g. the Sonnets) share cache entries
+PricingRates = Tuple[float, float]
+
+
+def _pricing_rates(pricing: ModelPricing) -> PricingRates:
+    """(input, output) cost per million tokens for a pricing entry"""
+    return pricing.input_cost_per_million, pricing.output_cost_per_million
+
+
+def _token_cost(rates: PricingRates, input_tokens: int, output_tokens: int) -> float:
+    """Cost of a single (input, output) token pair at the given rates"""
+    input_cost_per_million, output_cost_per_million = rates
+    return ((input_tokens / 1_000_000) * input_cost_per_million + 
+            (output_tokens / 1_000_000) * output_cost_per_million)
+
+
+@lru_cache(maxsize=256)
+def _estimate_phase_costs(
+    rates: PricingRates,
+    avg_turns_architecture: int,
+    avg_turns_per_component: int,
+    avg_turns_per_validation: int,
+    avg_tokens_per_turn: int
+) -> Tuple[float, float, float]:
+    """
+    Estimate per-phase costs for a multi-agent build
+    
+    The component count only scales the per-component costs, so it is left
+    out of the memoized arguments: one cache entry serves every build size.
+    
+    Returns:
+        Tuple of (architecture cost, cost per component, validation cost per component)
+    """
+    def phase_cost(total_tokens: int) -> float:
+        return _token_cost(
+            rates,
+            int(total_tokens * ESTIMATE_INPUT_RATIO),
+            int(total_tokens * ESTIMATE_OUTPUT_RATIO)
+        )
+    
+    # Phase 1: Architecture
+    arch_cost = phase_cost(avg_turns_architecture * avg_tokens_per_turn)
+    
+    # Phase 2: Components
+    comp_cost_per_comp = phase_cost(avg_turns_per_component * avg_tokens_per_turn)
+    
+    # Phase 3: Validation
+    val_cost_per_comp = phase_cost(avg_turns_per_validation * avg_tokens_per_turn)
+    
+    return arch_cost, comp_cost_per_comp, val_cost_per_comp
+
 
 @dataclass
 class TokenUsage:
@@ -82,6 +160,7 @@ class CostCalculator:
         """
         self.model = model
         self.pricing = CLAUDE_PRICING[model]
+        self._rates = _pricing_rates(self.pricing)
         self.token_usages: List[TokenUsage] = []
         
     def add_token_usage(
@@ -143,20 +222,12 @@ class CostCalculator:
         
         # Calculate phase costs
         phase_costs = {}
-        phase_mapping = {
-            "architecture_analysis": "Phase 1: Architecture",
-            "component_analysis": "Phase 2: Components", 
-            "validation": "Phase 3: Validation"
-        }
-        
-        for phase_key, phase_name in phase_mapping.items():
+        for phase_key, phase_name in PHASE_MAPPING.items():
             phase_usages = [u for u in self.token_usages if phase_key in u.operation_name.lower()]
             if phase_usages:
                 phase_input = sum(u.input_tokens for u in phase_usages)
                 phase_output = sum(u.output_tokens for u in phase_usages)
-                phase_input_cost = (phase_input / 1_000_000) * self.pricing.input_cost_per_million
-                phase_output_cost = (phase_output / 1_000_000) * self.pricing.output_cost_per_million
-                phase_costs[phase_name] = phase_input_cost + phase_output_cost
+                phase_costs[phase_name] = _token_cost(self._rates, phase_input, phase_output)
         
         # Calculate component costs
         component_costs = {}
@@ -165,23 +236,19 @@ class CostCalculator:
                 if usage.component_name not in component_costs:
                     component_costs[usage.component_name] = 0.0
                 
-                comp_input_cost = (usage.input_tokens / 1_000_000) * self.pricing.input_cost_per_million
-                comp_output_cost = (usage.output_tokens / 1_000_000) * self.pricing.output_cost_per_million
-                component_costs[usage.component_name] += comp_input_cost + comp_output_cost
+                component_costs[usage.component_name] += _token_cost(
+                    self._rates, usage.input_tokens, usage.output_tokens
+                )
         
         # Create operation cost details
         operation_costs = []
         for usage in self.token_usages:
-            op_input_cost = (usage.input_tokens / 1_000_000) * self.pricing.input_cost_per_million
-            op_output_cost = (usage.output_tokens / 1_000_000) * self.pricing.output_cost_per_million
-            op_total_cost = op_input_cost + op_output_cost
-            
             operation_costs.append({
                 "operation": usage.operation_name,
                 "component": usage.component_name,
                 "input_tokens": usage.input_tokens,
                 "output_tokens": usage.output_tokens,
-                "cost": op_total_cost
+                "cost": _token_cost(self._rates, usage.input_tokens, usage.output_tokens)
             })
         
         return CostBreakdown(
@@ -218,33 +285,19 @@ class CostCalculator:
         Returns:
             Dictionary with cost estimates
         """
-        # Estimate token distribution (roughly 60% input, 40% output)
-        input_ratio = 0.6
-        output_ratio = 0.4
+        arch_cost, comp_cost_per_comp, val_cost_per_comp = _estimate_phase_costs(
+            self._rates,
+            avg_turns_architecture,
+            avg_turns_per_component,
+            avg_turns_per_validation,
+            avg_tokens_per_turn
+        )
         
-        # Phase 1: Architecture
         arch_total_tokens = avg_turns_architecture * avg_tokens_per_turn
-        arch_input_tokens = int(arch_total_tokens * input_ratio)
-        arch_output_tokens = int(arch_total_tokens * output_ratio)
-        arch_cost = ((arch_input_tokens / 1_000_000) * self.pricing.input_cost_per_million + 
-                    (arch_output_tokens / 1_000_000) * self.pricing.output_cost_per_million)
-        
-        # Phase 2: Components
         comp_total_tokens_per_comp = avg_turns_per_component * avg_tokens_per_turn
-        comp_input_tokens_per_comp = int(comp_total_tokens_per_comp * input_ratio)
-        comp_output_tokens_per_comp = int(comp_total_tokens_per_comp * output_ratio)
-        comp_cost_per_comp = ((comp_input_tokens_per_comp / 1_000_000) * self.pricing.input_cost_per_million + 
-                             (comp_output_tokens_per_comp / 1_000_000) * self.pricing.output_cost_per_million)
         comp_total_cost = comp_cost_per_comp * num_components
-        
-        # Phase 3: Validation
         val_total_tokens_per_comp = avg_turns_per_validation * avg_tokens_per_turn
-        val_input_tokens_per_comp = int(val_total_tokens_per_comp * input_ratio)
-        val_output_tokens_per_comp = int(val_total_tokens_per_comp * output_ratio)
-        val_cost_per_comp = ((val_input_tokens_per_comp / 1_000_000) * self.pricing.input_cost_per_million + 
-                            (val_output_tokens_per_comp / 1_000_000) * self.pricing.output_cost_per_million)
         val_total_cost = val_cost_per_comp * num_components
-        
         total_estimated_cost = arch_cost + comp_total_cost + val_total_cost
         
         return {
@@ -322,8 +375,15 @@ class CostCalculator:
             report_data["build_metadata"] = build_metadata
         
         cost_report_path = output_path / "cost_analysis.json"
-        with open(cost_report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        if orjson is not None:
+            cost_report_path.write_bytes(orjson.dumps(
+                report_data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            with open(cost_report_path, 'w') as f:
+                json.dump(report_data, f, indent=2, default=_json_default)
         
         logger.info(f"Cost report saved to: {cost_report_path}")
         
@@ -333,36 +393,42 @@ class CostCalculator:
         """Print a formatted cost summary to console"""
         cost_breakdown = self.calculate_cost()
         
-        print("\n" + "=" * 60)
-        print(f"💰 COST ANALYSIS - {cost_breakdown.model_used}")
-        print("=" * 60)
+        # Collect lines and emit them with a single write
+        lines = [
+            "\n" + "=" * 60,
+            f"💰 COST ANALYSIS - {cost_breakdown.model_used}",
+            "=" * 60
+        ]
         
         if cost_breakdown.total_cost == 0:
-            print("No token usage recorded - no costs incurred.")
+            lines.append("No token usage recorded - no costs incurred.")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
-        print(f"📊 Token Usage:")
-        print(f"   • Input Tokens:  {cost_breakdown.total_input_tokens:,}")
-        print(f"   • Output Tokens: {cost_breakdown.total_output_tokens:,}")
-        print(f"   • Total Tokens:  {cost_breakdown.total_tokens:,}")
-        
-        print(f"\n💵 Cost Breakdown:")
-        print(f"   • Input Cost:   ${cost_breakdown.input_cost:.4f}")
-        print(f"   • Output Cost:  ${cost_breakdown.output_cost:.4f}")
-        print(f"   • TOTAL COST:   ${cost_breakdown.total_cost:.4f}")
+        lines.extend([
+            f"📊 Token Usage:",
+            f"   • Input Tokens:  {cost_breakdown.total_input_tokens:,}",
+            f"   • Output Tokens: {cost_breakdown.total_output_tokens:,}",
+            f"   • Total Tokens:  {cost_breakdown.total_tokens:,}",
+            f"\n💵 Cost Breakdown:",
+            f"   • Input Cost:   ${cost_breakdown.input_cost:.4f}",
+            f"   • Output Cost:  ${cost_breakdown.output_cost:.4f}",
+            f"   • TOTAL COST:   ${cost_breakdown.total_cost:.4f}"
+        ])
         
         if cost_breakdown.phase_costs:
-            print(f"\n🔍 Phase Costs:")
+            lines.append(f"\n🔍 Phase Costs:")
             for phase, cost in cost_breakdown.phase_costs.items():
-                print(f"   • {phase}: ${cost:.4f}")
+                lines.append(f"   • {phase}: ${cost:.4f}")
         
         if cost_breakdown.component_costs:
-            print(f"\n🧩 Top Component Costs:")
+            lines.append(f"\n🧩 Top Component Costs:")
             sorted_comps = sorted(cost_breakdown.component_costs.items(), 
                                 key=lambda x: x[1], reverse=True)
             for comp, cost in sorted_comps[:5]:  # Show top 5
-                print(f"   • {comp}: ${cost:.4f}")
+                lines.append(f"   • {comp}: ${cost:.4f}")
             if len(sorted_comps) > 5:
-                print(f"   ... and {len(sorted_comps) - 5} more components")
+                lines.append(f"   ... and {len(sorted_comps) - 5} more components")
         
-        print("=" * 60)
\ No newline at end of file
+        lines.append("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
@@ -7,16 +7,47 @@ for cost calculation and analysis.
 
 import json
 import logging
-from datetime import datetime, timezone
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 import re
+from itertools import chain
 
-from .cost_calculator import CostCalculator, ClaudeModel, TokenUsage
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .cost_calculator import (
+    CostCalculator, ClaudeModel, TokenUsage, CLAUDE_PRICING, _pricing_rates, _token_cost
+)
 
 logger = logging.getLogger(__name__)
 
+# Tolerance when comparing file mtimes against session timestamps
+SESSION_MTIME_SLACK = timedelta(minutes=5)
+
+# Claude names project directories after the path with / and _ mapped to -
+_PROJECT_KEY_TABLE = str.maketrans({"/": "-", "_": "-"})
+
+# Uncached session files needed before parallel parsing uses a process pool
+PARALLEL_PARSE_THRESHOLD = 8
+
+# Environment switch for the on-disk parsed-session cache (off unless "true")
+SESSION_CACHE_ENV = "MEMORY_BANK_SESSION_CACHE"
+
+# Environment switch for parsing session files in a process pool (off unless "true")
+SESSION_PARALLEL_ENV = "MEMORY_BANK_PARALLEL_SESSIONS"
+
+# Bumped whenever the cached entry layout or SessionTokenUsage changes; a cache
+# written with another version is discarded
+SESSION_CACHE_VERSION = 1
+
 
 @dataclass
 class SessionTokenUsage:
@@ -33,26 +64,232 @@ class SessionTokenUsage:
     working_directory: str
 
 
+def _usage_to_dict(session_usage: SessionTokenUsage) -> Dict[str, Any]:
+    """Convert a SessionTokenUsage into a JSON-serializable dict"""
+    data = asdict(session_usage)
+    data["session_start"] = session_usage.session_start.isoformat()
+    data["session_end"] = session_usage.session_end.isoformat()
+    return data
+
+
+def _usage_from_dict(data: Dict[str, Any]) -> SessionTokenUsage:
+    """Rebuild a SessionTokenUsage from its cached dict form"""
+    return SessionTokenUsage(**{
+        **data,
+        "session_start": datetime.fromisoformat(data["session_start"]),
+        "session_end": datetime.fromisoformat(data["session_end"])
+    })
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch the stdlib exception regardless of which decoder is active
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _later_timestamp(timestamp_str: Optional[str], current: datetime) -> datetime:
+    """Return the parsed timestamp if it is later than current, else current"""
+    if timestamp_str:
+        try:
+            timestamp = datetime.fromisoformat(timestamp_str)
+            if timestamp > current:
+                return timestamp
+        except (ValueError, TypeError):
+            pass  # Skip invalid timestamps
+    return current
+
+
+def _iter_session_records(f):
+    """Yield decoded records from a binary JSONL stream, skipping undecodable lines"""
+    for line in f:
+        try:
+            yield _json_loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def _read_session_start(session_file: Path) -> Optional[datetime]:
+    """
+    Read the session start timestamp from the first line of a session file
+    
+    Only the first line is read and decoded, so this is cheap enough to run
+    before deciding whether a file needs a full parse.
+    
+    Returns:
+        Timezone-aware start time, or None if it cannot be determined
+    """
+    try:
+        with open(session_file, 'rb') as f:
+            first_line = _json_loads(f.readline())
+        session_start = datetime.fromisoformat(first_line["timestamp"])
+    except Exception:
+        return None
+    
+    if session_start.tzinfo is None:
+        session_start = session_start.replace(tzinfo=timezone.utc)
+    return session_start
+
+
+def _parse_session_file(session_file: Path) -> Optional[SessionTokenUsage]:
+    """
+    Parse a single JSONL session file to extract token usage
+    
+    Args:
+        session_file: Path to the JSONL session file
+        
+    Returns:
+        SessionTokenUsage object or None if parsing fails
+    """
+    try:
+        with open(session_file, 'rb') as f:
+            first_raw = f.readline()
+            if not first_raw:
+                return None
+            
+            # Parse session metadata from first line
+            first_line = _json_loads(first_raw)
+            session_id = first_line.get("sessionId", session_file.stem)
+            working_directory = first_line.get("cwd", "unknown")
+            
+            # Handle timestamp parsing with fallback
+            timestamp_str = first_line.get("timestamp", "")
+            if timestamp_str:
+                try:
+                    session_start = datetime.fromisoformat(timestamp_str)
+                except (ValueError, TypeError):
+                    # Fallback to file modification time
+                    session_start = datetime.fromtimestamp(session_file.stat().st_mtime, timezone.utc)
+            else:
+                # Use file modification time if no timestamp
+                session_start = datetime.fromtimestamp(session_file.stat().st_mtime, timezone.utc)
+            
+            # Parse all lines to extract token usage
+            total_input_tokens = 0
+            total_output_tokens = 0
+            total_cache_creation_tokens = 0
+            total_cache_read_tokens = 0
+            message_count = 0
+            model_used = "unknown"
+            session_end = session_start
+            
+            # Ensure session_start is timezone-aware for comparisons
+            if session_start.tzinfo is None:
+                session_start = session_start.replace(tzinfo=timezone.utc)
+                session_end = session_start
+            
+            # The first line is already decoded; stream the rest from the file
+            for data in chain((first_line,), _iter_session_records(f)):
+                # Update session end time
+                if "timestamp" in data:
+                    session_end = _later_timestamp(data["timestamp"], session_end)
+                
+                # Extract token usage from assistant messages
+                if (data.get("type") == "assistant" and 
+                    "message" in data and 
+                    "usage" in data["message"]):
+                    
+                    usage = data["message"]["usage"]
+                    total_input_tokens += usage.get("input_tokens", 0)
+                    total_output_tokens += usage.get("output_tokens", 0)
+                    total_cache_creation_tokens += usage.get("cache_creation_input_tokens", 0)
+                    total_cache_read_tokens += usage.get("cache_read_input_tokens", 0)
+                    message_count += 1
+                    
+                    # Get model information
+                    if "model" in data["message"]:
+                        model_used = data["message"]["model"]
+        
+        return SessionTokenUsage(
+            session_id=session_id,
+            session_start=session_start,
+            session_end=session_end,
+            total_input_tokens=total_input_tokens,
+            total_output_tokens=total_output_tokens,
+            cache_creation_tokens=total_cache_creation_tokens,
+            cache_read_tokens=total_cache_read_tokens,
+            message_count=message_count,
+            model_used=model_used,
+            working_directory=working_directory
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to parse session file {session_file}: {e}")
+        return None
+
+
 class SessionParser:
     """Parses Claude Code JSONL session files"""
     
-    def __init__(self):
-        """Initialize the session parser"""
+    def __init__(
+        self,
+        cache_path: Optional[Path] = None,
+        use_cache: Optional[bool] = None,
+        parallel: Optional[bool] = None
+    ):
+        """
+        Initialize the session parser
+        
+        Args:
+            cache_path: Where to persist parsed session results
+                (defaults to ~/.cache/memory_bank/session_cache.json)
+            use_cache: Whether to persist and reuse results for unchanged
+                session files; defaults to MEMORY_BANK_SESSION_CACHE=true
+            parallel: Whether large batches of uncached files may be parsed in
+                a (spawned) process pool; defaults to
+                MEMORY_BANK_PARALLEL_SESSIONS=true, serial otherwise
+        """
         self.claude_projects_dir = Path.home() / ".claude" / "projects"
+        self.cache_path = cache_path or Path.home() / ".cache" / "memory_bank" / "session_cache.json"
+        if use_cache is None:
+            use_cache = os.getenv(SESSION_CACHE_ENV, "false").lower() == "true"
+        self.use_cache = use_cache
+        if parallel is None:
+            parallel = os.getenv(SESSION_PARALLEL_ENV, "false").lower() == "true"
+        self.parallel = parallel
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cache_dirty = False
         
-    def find_project_sessions(self, project_path: str) -> List[Path]:
+    def find_project_sessions(
+        self, 
+        project_path: str,
+        modified_since: Optional[datetime] = None
+    ) -> List[Path]:
         """
         Find all session files for a specific project
         
         Args:
             project_path: Path to the project directory
+            modified_since: Optional cutoff - files last modified before it are
+                skipped without being opened
             
         Returns:
-            List of session file paths
+            List of session file paths (newest first)
         """
+        project_dirs = self._find_project_dirs(project_path)
+        
+        # Pre-filter on mtime before any JSON decoding
+        min_mtime = (modified_since - SESSION_MTIME_SLACK).timestamp() if modified_since else None
+        
+        # Collect all JSONL files from matching directories, stat'ing each entry once
+        session_entries = []
+        for project_dir in project_dirs:
+            with os.scandir(project_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.name.endswith(".jsonl"):
+                        continue
+                    mtime = entry.stat().st_mtime
+                    if min_mtime is not None and mtime < min_mtime:
+                        continue
+                    session_entries.append((mtime, Path(entry.path)))
+        
+        # Sort by modification time (newest first)
+        session_entries.sort(key=lambda item: item[0], reverse=True)
+        
+        return [file_path for _, file_path in session_entries]
+    
+    def _find_project_dirs(self, project_path: str) -> List[Path]:
+        """Find the Claude projects directories that hold sessions for a project"""
         # Convert project path to Claude's naming convention
         # Replace / with - and _ with - (Claude normalizes underscores to hyphens)
-        project_key = project_path.replace("/", "-").replace("_", "-")
+        project_key = project_path.translate(_PROJECT_KEY_TABLE)
         if not project_key.startswith("-"):
             project_key = "-" + project_key
         
@@ -62,116 +299,182 @@ class SessionParser:
             for dir_path in self.claude_projects_dir.iterdir():
                 if dir_path.is_dir() and project_key in dir_path.name:
                     project_dirs.append(dir_path)
+        return project_dirs
+    
+    def session_signature(self, project_path: str) -> Tuple[int, int]:
+        """
+        Cheap fingerprint of a project's session files
         
-        # Collect all JSONL files from matching directories
-        session_files = []
-        for project_dir in project_dirs:
-            for file_path in project_dir.glob("*.jsonl"):
-                session_files.append(file_path)
-        
-        # Sort by modification time (newest first)
-        session_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        
-        return session_files
+        Returns:
+            Tuple of (number of session files, newest mtime in nanoseconds);
+            it changes whenever a session file is added, removed or written
+        """
+        count = 0
+        newest_mtime_ns = 0
+        for project_dir in self._find_project_dirs(project_path):
+            with os.scandir(project_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.name.endswith(".jsonl"):
+                        continue
+                    count += 1
+                    newest_mtime_ns = max(newest_mtime_ns, entry.stat().st_mtime_ns)
+        return count, newest_mtime_ns
     
     def parse_session_file(self, session_file: Path) -> Optional[SessionTokenUsage]:
         """
         Parse a single JSONL session file to extract token usage
         
+        With the cache enabled, results are stored on disk keyed by
+        (path, mtime, size) so unchanged session files are never decoded twice.
+        
         Args:
             session_file: Path to the JSONL session file
             
         Returns:
             SessionTokenUsage object or None if parsing fails
         """
-        try:
-            with open(session_file, 'r') as f:
-                lines = f.readlines()
+        return self.parse_session_files([session_file])[0]
+    
+    def parse_session_files(
+        self,
+        session_files: List[Path],
+        time_filter: Optional[Tuple[datetime, datetime]] = None
+    ) -> List[Optional[SessionTokenUsage]]:
+        """
+        Parse several JSONL session files, reusing cached results where possible
+        
+        Cache misses are parsed in-process, or in a process pool when parallel
+        parsing is enabled and there are enough of them to outweigh the worker
+        start-up cost.
+        
+        Args:
+            session_files: Paths to the JSONL session files
+            time_filter: Optional (start_time, end_time); uncached files whose
+                first-line timestamp falls outside it are skipped (None) without
+                a full parse
             
-            if not lines:
-                return None
+        Returns:
+            SessionTokenUsage (or None on failure) for each file, in input order
+        """
+        results: List[Optional[SessionTokenUsage]] = [None] * len(session_files)
+        misses = []
+        
+        cache = self._load_cache() if self.use_cache else {}
+        for index, session_file in enumerate(session_files):
+            if not self.use_cache:
+                misses.append((index, session_file, None))
+                continue
             
-            # Parse session metadata from first line
-            first_line = json.loads(lines[0])
-            session_id = first_line.get("sessionId", session_file.stem)
-            working_directory = first_line.get("cwd", "unknown")
+            try:
+                stat = session_file.stat()
+            except OSError as e:
+                logger.error(f"Failed to parse session file {session_file}: {e}")
+                continue
             
-            # Handle timestamp parsing with fallback
-            timestamp_str = first_line.get("timestamp", "")
-            if timestamp_str:
+            results[index] = self._cached_usage(cache.get(str(session_file)), stat)
+            if results[index] is None:
+                misses.append((index, session_file, stat))
+        
+        if time_filter:
+            misses = [miss for miss in misses if self._starts_within(miss[1], time_filter)]
+        
+        miss_paths = [session_file for _, session_file, _ in misses]
+        for (index, session_file, stat), session_usage in zip(misses, self._parse_uncached(miss_paths)):
+            results[index] = session_usage
+            if session_usage and stat is not None:
+                cache[str(session_file)] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "usage": _usage_to_dict(session_usage)
+                }
+                self._cache_dirty = True
+        
+        self.save_cache()
+        
+        return results
+    
+    def _parse_uncached(self, session_files: List[Path]) -> List[Optional[SessionTokenUsage]]:
+        """Decode session files, fanning out to worker processes if enabled"""
+        workers = min(os.cpu_count() or 1, len(session_files))
+        if self.parallel and len(session_files) >= PARALLEL_PARSE_THRESHOLD and workers > 1:
+            # Spawn rather than fork: callers may be multi-threaded or running
+            # an event loop, which forked children would inherit mid-flight
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    return list(executor.map(_parse_session_file, session_files, chunksize=4))
+            except Exception as e:
+                # _parse_session_file never raises, so anything here is the
+                # executor itself failing (broken pool, OSError, pickling)
+                logger.warning(f"Parallel session parsing unavailable, parsing serially: {e}")
+        
+        return [_parse_session_file(session_file) for session_file in session_files]
+    
+    @staticmethod
+    def _cached_usage(entry: Any, stat: os.stat_result) -> Optional[SessionTokenUsage]:
+        """Rebuild a cached result if it is still valid for the file's stat"""
+        try:
+            if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                return _usage_from_dict(entry["usage"])
+        except (KeyError, TypeError, ValueError):
+            pass  # Malformed entry: treat as a miss and overwrite it
+        return None
+    
+    @staticmethod
+    def _starts_within(session_file: Path, time_filter: Tuple[datetime, datetime]) -> bool:
+        """Check a file's first-line timestamp against the time filter"""
+        start_time, end_time = time_filter
+        session_start = _read_session_start(session_file)
+        # Files without a readable start timestamp are left to the full parse
+        return session_start is None or start_time <= session_start <= end_time
+    
+    def save_cache(self):
+        """Write the parsed-session cache back to disk if it changed"""
+        if not self._cache_dirty or self._cache is None:
+            return
+        
+        # Drop entries for session files that no longer exist
+        self._cache = {path: entry for path, entry in self._cache.items() if os.path.exists(path)}
+        
+        # Write to a uniquely named temp file and swap it in, so concurrent
+        # writers never clobber each other's partial output
+        tmp_name = None
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=self.cache_path.parent, prefix=self.cache_path.name, suffix=".tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                json.dump({"version": SESSION_CACHE_VERSION, "sessions": self._cache}, f)
+            os.replace(tmp_name, self.cache_path)
+            self._cache_dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save session cache {self.cache_path}: {e}")
+            if tmp_name is not None:
                 try:
-                    session_start = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    # Fallback to file modification time
-                    session_start = datetime.fromtimestamp(session_file.stat().st_mtime, timezone.utc)
-            else:
-                # Use file modification time if no timestamp
-                session_start = datetime.fromtimestamp(session_file.stat().st_mtime, timezone.utc)
-            
-            # Parse all lines to extract token usage
-            total_input_tokens = 0
-            total_output_tokens = 0
-            total_cache_creation_tokens = 0
-            total_cache_read_tokens = 0
-            message_count = 0
-            model_used = "unknown"
-            session_end = session_start
-            
-            # Ensure session_start is timezone-aware for comparisons
-            if session_start.tzinfo is None:
-                session_start = session_start.replace(tzinfo=timezone.utc)
-                session_end = session_start
-            
-            for line in lines:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the parsed-session cache from disk once per parser"""
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path.exists():
                 try:
-                    data = json.loads(line)
-                    
-                    # Update session end time
-                    if "timestamp" in data:
-                        timestamp_str = data["timestamp"]
-                        if timestamp_str:
-                            try:
-                                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                                if timestamp > session_end:
-                                    session_end = timestamp
-                            except (ValueError, AttributeError):
-                                pass  # Skip invalid timestamps
-                    
-                    # Extract token usage from assistant messages
-                    if (data.get("type") == "assistant" and 
-                        "message" in data and 
-                        "usage" in data["message"]):
-                        
-                        usage = data["message"]["usage"]
-                        total_input_tokens += usage.get("input_tokens", 0)
-                        total_output_tokens += usage.get("output_tokens", 0)
-                        total_cache_creation_tokens += usage.get("cache_creation_input_tokens", 0)
-                        total_cache_read_tokens += usage.get("cache_read_input_tokens", 0)
-                        message_count += 1
-                        
-                        # Get model information
-                        if "model" in data["message"]:
-                            model_used = data["message"]["model"]
-                
-                except json.JSONDecodeError:
-                    continue
-            
-            return SessionTokenUsage(
-                session_id=session_id,
-                session_start=session_start,
-                session_end=session_end,
-                total_input_tokens=total_input_tokens,
-                total_output_tokens=total_output_tokens,
-                cache_creation_tokens=total_cache_creation_tokens,
-                cache_read_tokens=total_cache_read_tokens,
-                message_count=message_count,
-                model_used=model_used,
-                working_directory=working_directory
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to parse session file {session_file}: {e}")
-            return None
+                    with open(self.cache_path, 'r') as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable session cache {self.cache_path}: {e}")
+                else:
+                    if (isinstance(data, dict) and data.get("version") == SESSION_CACHE_VERSION
+                            and isinstance(data.get("sessions"), dict)):
+                        self._cache = data["sessions"]
+                    else:
+                        logger.info(f"Discarding outdated session cache {self.cache_path}")
+        return self._cache
     
     def get_project_token_usage(
         self, 
@@ -190,15 +493,19 @@ class SessionParser:
         Returns:
             List of SessionTokenUsage objects
         """
-        session_files = self.find_project_sessions(project_path)
+        # A session file last written before the window opened cannot hold a
+        # session that starts inside it, so skip those files up front
+        session_files = self.find_project_sessions(
+            project_path,
+            modified_since=time_filter[0] if time_filter else None
+        )
         
         if session_limit:
             session_files = session_files[:session_limit]
         
         session_usages = []
         
-        for session_file in session_files:
-            session_usage = self.parse_session_file(session_file)
+        for session_usage in self.parse_session_files(session_files, time_filter):
             if session_usage:
                 # Apply time filter if specified
                 if time_filter:
@@ -265,8 +572,6 @@ class SessionParser:
         Returns:
             Dictionary with usage analysis
         """
-        from datetime import timedelta
-        
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=hours)
         
@@ -316,6 +621,10 @@ class SessionParser:
         }
 
 
+# Parsed sessions per project path, reused while the session signature is unchanged
+_detected_sessions_cache: Dict[str, Tuple[Tuple[int, int], List[SessionTokenUsage]]] = {}
+
+
 def detect_memory_bank_sessions(project_path: str) -> List[Dict[str, Any]]:
     """
     Detect which sessions were likely related to memory bank building
@@ -328,31 +637,38 @@ def detect_memory_bank_sessions(project_path: str) -> List[Dict[str, Any]]:
         List of session information dictionaries
     """
     parser = SessionParser()
-    sessions = parser.get_project_token_usage(project_path)
+    signature = parser.session_signature(project_path)
+    cached = _detected_sessions_cache.get(project_path)
+    if cached and cached[0] == signature:
+        sessions = cached[1]
+    else:
+        sessions = parser.get_project_token_usage(project_path)
+        _detected_sessions_cache[project_path] = (signature, sessions)
     
     memory_bank_sessions = []
     
+    # Price sessions directly rather than building a CostCalculator per session
+    rates = _pricing_rates(CLAUDE_PRICING[ClaudeModel.CLAUDE_4_SONNET])
+    now = datetime.now(timezone.utc)
+    
     for session in sessions:
-        # Check if session is recent (within last few days for multi-agent work)
-        # Make sure both datetimes have timezone info for comparison
-        now = datetime.now(timezone.utc)
-        session_start = session.session_start
-        if session_start.tzinfo is None:
-            session_start = session_start.replace(tzinfo=timezone.utc)
-        days_old = (now - session_start).days
-        
         # Look for sessions with high token usage (likely multi-agent builds)
         total_tokens = session.total_input_tokens + session.total_output_tokens
         
         # Sessions with >50k tokens and recent are likely memory bank builds
         if total_tokens > 50000 or session.message_count > 100:
-            calculator = CostCalculator()
-            calculator.add_token_usage(
+            # Check if session is recent (within last few days for multi-agent work)
+            # Make sure both datetimes have timezone info for comparison
+            session_start = session.session_start
+            if session_start.tzinfo is None:
+                session_start = session_start.replace(tzinfo=timezone.utc)
+            days_old = (now - session_start).days
+            
+            cost = _token_cost(
+                rates,
                 session.total_input_tokens + session.cache_creation_tokens,
-                session.total_output_tokens,
-                f"session_{session.session_id[:8]}"
+                session.total_output_tokens
             )
-            cost = calculator.calculate_cost().total_cost
             
             memory_bank_sessions.append({
                 "session_id": session.session_id[:8],